@@ -1,97 +1,253 @@
-import heapq
-import math
-
-def mst_cost(graph, vertices):
-    """Compute the cost of the Minimum Spanning Tree for vertices using Prim's algorithm."""
-    if not vertices:
-        return 0
-    n = len(graph)
-    visited = set([vertices[0]])
-    edges = [(graph[vertices[0]][j], vertices[0], j) for j in range(n) if j in vertices[1:]]
-    heapq.heapify(edges)
-    total_cost = 0
-
-    while edges and len(visited) < len(vertices):
-        cost, u, v = heapq.heappop(edges)
-        if v not in visited:
-            visited.add(v)
-            total_cost += cost
-            for w in range(n):
-                if w in vertices and w not in visited:
-                    heapq.heappush(edges, (graph[v][w], v, w))
-
-    return total_cost
-
-def astar_tsp(graph, start=0):
-    n = len(graph)  # Number of cities
-    # State: (f_score, current_city, visited_cities, g_score, path)
-    pq = [(0, start, frozenset([start]), 0, [start])]
-    visited_states = {}  # (current_city, visited_cities): min g_score
-    best_tour = None
-    best_distance = float('inf')
-
-    print(f"Starting A* TSP from city {start}")
-    while pq:
-        f_score, current, visited, g_score, path = heapq.heappop(pq)
-        print(f"Exploring state: current={current}, path={path}, g={g_score}, f={f_score}")
-
-        # If all cities visited, try returning to start
-        if len(visited) == n:
-            return_distance = graph[current][start]
-            total_distance = g_score + return_distance
-            if total_distance < best_distance:
-                best_tour = path + [start]
-                best_distance = total_distance
-                print(f"Found tour: {best_tour}, distance={best_distance}")
-            continue
-
-        # Skip if we've seen this state with a lower g_score
-        state_key = (current, visited)
-        if state_key in visited_states and visited_states[state_key] <= g_score:
-            continue
-        visited_states[state_key] = g_score
-
-        # Explore unvisited cities
-        unvisited = [i for i in range(n) if i not in visited]
-        for next_city in unvisited:
-            new_visited = frozenset(visited | {next_city})
-            new_g_score = g_score + graph[current][next_city]
-
-            # Heuristic: MST cost of unvisited cities + min edges to connect
-            remaining = [i for i in range(n) if i not in new_visited]
-            mst = mst_cost(graph, remaining)
-            # Min distance from current to remaining (if any)
-            min_to_remaining = min((graph[next_city][i] for i in remaining), default=0)
-            # Min distance from remaining to start (if any)
-            min_to_start = min((graph[i][start] for i in remaining), default=0)
-            h_score = mst + min_to_remaining + min_to_start
-            f_score = new_g_score + h_score
-
-            new_path = path + [next_city]
-            print(f"  Adding next={next_city}, g={new_g_score}, h={h_score}, f={f_score}")
-            heapq.heappush(pq, (f_score, next_city, new_visited, new_g_score, new_path))
-
-    return best_tour, best_distance
-
-# Example usage
-def main():
-    # Sample distance matrix (symmetric, undirected graph)
-    graph = [
-        [0, 10, 15, 20, 25],
-        [10, 0, 35, 25, 30],
-        [15, 35, 0, 30, 20],
-        [20, 25, 30, 0, 15],
-        [25, 30, 20, 15, 0]
-    ]
-
-    # Run A* starting from city 0
-    tour, distance = astar_tsp(graph, start=0)
-
-    if tour:
-        print("A* TSP Tour:", " -> ".join(map(str, tour)))
-        print("Total Distance:", distance)
-    else:
-        print("No tour found")
-
-if __name__ == "__main__":
+import heapq
+import math
+from array import array
+from functools import lru_cache
+
+def prim(graph, vertices, penalty=None):
+    """Array-based O(k^2) Prim's over vertices; returns (cost, degree of each vertex)."""
+    k = len(vertices)
+    in_tree = [False] * k
+    best = [math.inf] * k  # Cheapest edge linking each vertex to the tree
+    link = [-1] * k
+    degree = [0] * k
+    best[0] = 0
+    total_cost = 0
+
+    for _ in range(k):
+        u = min((i for i in range(k) if not in_tree[i]), key=best.__getitem__)
+        in_tree[u] = True
+        total_cost += best[u]
+        if link[u] >= 0:
+            degree[u] += 1
+            degree[link[u]] += 1
+        row = graph[vertices[u]]
+        for v in range(k):
+            if not in_tree[v]:
+                w = row[vertices[v]]
+                if penalty is not None:
+                    w += penalty[u] + penalty[v]
+                if w < best[v]:
+                    best[v] = w
+                    link[v] = u
+
+    return total_cost, degree
+
+def mst_cost(graph, vertices):
+    """Compute the cost of the Minimum Spanning Tree for vertices using Prim's algorithm."""
+    if not vertices:
+        return 0
+    return prim(graph, vertices)[0]
+
+class MSTHeuristic:
+    """A* TSP heuristic service with LRU caches keyed by the remaining-set bitmask.
+
+    The default bound is MST(remaining) plus the cheapest edge out of the
+    current city and the cheapest edge back to start. With one_tree=True
+    it is tightened into a Held-Karp 1-tree bound: a few subgradient steps
+    on city penalties push every remaining city toward degree 2.
+    """
+
+    def __init__(self, graph, start=0, one_tree=False, iterations=20, cache_size=1 << 16):
+        self.graph = graph
+        self.n = len(graph)
+        self.start = start
+        self.one_tree = one_tree
+        self.iterations = iterations
+        self.mst = lru_cache(maxsize=cache_size)(self._mst)
+        self.one_tree_bound = lru_cache(maxsize=cache_size)(self._one_tree_bound)
+
+    def vertices(self, mask):
+        return [i for i in range(self.n) if mask >> i & 1]
+
+    def _mst(self, mask):
+        return mst_cost(self.graph, self.vertices(mask))
+
+    def _one_tree_bound(self, current, mask):
+        graph, start = self.graph, self.start
+        remaining = self.vertices(mask)
+        k = len(remaining)
+        penalty = [0.0] * k
+        best_bound = 0
+        step = 1.0
+        for _ in range(self.iterations):
+            tree_cost, degree = prim(graph, remaining, penalty)
+            out_edges = [graph[current][r] + penalty[i] for i, r in enumerate(remaining)]
+            in_edges = [graph[r][start] + penalty[i] for i, r in enumerate(remaining)]
+            first = min(range(k), key=out_edges.__getitem__)
+            last = min(range(k), key=in_edges.__getitem__)
+            bound = tree_cost + out_edges[first] + in_edges[last] - 2 * sum(penalty)
+            best_bound = max(best_bound, bound)
+
+            # Subgradient step: every remaining city should have degree 2
+            degree[first] += 1
+            degree[last] += 1
+            gradient = [d - 2 for d in degree]
+            norm = sum(g * g for g in gradient)
+            if norm == 0:  # The 1-tree is already a Hamiltonian path
+                break
+            step_size = step * max(bound, 1) / (k * norm)
+            penalty = [p + step_size * g for p, g in zip(penalty, gradient)]
+            step *= 0.9
+        return best_bound
+
+    def __call__(self, current, mask):
+        """Lower bound on the cost from current through all cities in mask back to start."""
+        graph, start = self.graph, self.start
+        if not mask:
+            return graph[current][start]
+        remaining = self.vertices(mask)
+        if len(remaining) == 1:
+            return graph[current][remaining[0]] + graph[remaining[0]][start]
+        if self.one_tree:
+            return self.one_tree_bound(current, mask)
+        min_to_remaining = min(graph[current][i] for i in remaining)
+        min_to_start = min(graph[i][start] for i in remaining)
+        return self.mst(mask) + min_to_remaining + min_to_start
+
+def astar_tsp(graph, start=0, one_tree=False):
+    n = len(graph)  # Number of cities
+    heuristic = MSTHeuristic(graph, start, one_tree=one_tree)
+    # State: (f_score, current_city, visited_cities, g_score, path)
+    pq = [(0, start, frozenset([start]), 0, [start])]
+    visited_states = {}  # (current_city, visited_cities): min g_score
+    best_tour = None
+    best_distance = float('inf')
+
+    print(f"Starting A* TSP from city {start}")
+    while pq:
+        f_score, current, visited, g_score, path = heapq.heappop(pq)
+        # Admissible bound: nothing left on the queue can beat the best tour
+        if f_score >= best_distance:
+            break
+        print(f"Exploring state: current={current}, path={path}, g={g_score}, f={f_score}")
+
+        # If all cities visited, try returning to start
+        if len(visited) == n:
+            return_distance = graph[current][start]
+            total_distance = g_score + return_distance
+            if total_distance < best_distance:
+                best_tour = path + [start]
+                best_distance = total_distance
+                print(f"Found tour: {best_tour}, distance={best_distance}")
+            continue
+
+        # Skip if we've seen this state with a lower g_score
+        state_key = (current, visited)
+        if state_key in visited_states and visited_states[state_key] <= g_score:
+            continue
+        visited_states[state_key] = g_score
+
+        # Explore unvisited cities
+        unvisited = [i for i in range(n) if i not in visited]
+        for next_city in unvisited:
+            new_visited = frozenset(visited | {next_city})
+            new_g_score = g_score + graph[current][next_city]
+
+            # Heuristic: MST cost of unvisited cities + min edges to connect
+            remaining = sum(1 << i for i in range(n) if i not in new_visited)
+            h_score = heuristic(next_city, remaining)
+            f_score = new_g_score + h_score
+
+            new_path = path + [next_city]
+            print(f"  Adding next={next_city}, g={new_g_score}, h={h_score}, f={f_score}")
+            heapq.heappush(pq, (f_score, next_city, new_visited, new_g_score, new_path))
+
+    return best_tour, best_distance
+
+def reconstruct_path(node, node_city, node_parent):
+    """Follow parent pointers from a search node back to the start city."""
+    path = []
+    while node != -1:
+        path.append(node_city[node])
+        node = node_parent[node]
+    return path[::-1]
+
+def astar_tsp_bitmask(graph, start=0, verbose=False, one_tree=False):
+    """A* TSP with visited sets as integer bitmasks and a parent-pointer table.
+
+    Each search node is one entry in flat arrays (city, visited mask, parent),
+    the heap holds (f_score, g_score, node) and visited_states is keyed by a
+    single integer, so no frozenset or path list is copied per node.
+    """
+    n = len(graph)  # Number of cities
+    if n > 63:
+        raise ValueError("Bitmask A* supports at most 63 cities")
+    full_mask = (1 << n) - 1
+    heuristic = MSTHeuristic(graph, start, one_tree=one_tree)
+    node_city = array('i', [start])
+    node_mask = array('q', [1 << start])
+    node_parent = array('i', [-1])
+    pq = [(0, 0, 0)]
+    visited_states = {}  # visited_mask * n + current_city: min g_score
+    best_tour = None
+    best_distance = float('inf')
+
+    print(f"Starting bitmask A* TSP from city {start}")
+    while pq:
+        f_score, g_score, node = heapq.heappop(pq)
+        if f_score >= best_distance:
+            break
+        current = node_city[node]
+        visited = node_mask[node]
+        if verbose:
+            print(f"Exploring state: current={current}, visited={visited:0{n}b}, g={g_score}, f={f_score}")
+
+        # If all cities visited, try returning to start
+        if visited == full_mask:
+            total_distance = g_score + graph[current][start]
+            if total_distance < best_distance:
+                best_tour = reconstruct_path(node, node_city, node_parent) + [start]
+                best_distance = total_distance
+                print(f"Found tour: {best_tour}, distance={best_distance}")
+            continue
+
+        # Skip if we've seen this state with a lower g_score
+        state_key = visited * n + current
+        if state_key in visited_states and visited_states[state_key] <= g_score:
+            continue
+        visited_states[state_key] = g_score
+
+        # Explore unvisited cities
+        unvisited = [i for i in range(n) if not visited >> i & 1]
+        for next_city in unvisited:
+            new_g_score = g_score + graph[current][next_city]
+
+            # Heuristic: cached MST (or 1-tree) bound on the remaining bitmask
+            h_score = heuristic(next_city, full_mask ^ visited ^ (1 << next_city))
+            f_score = new_g_score + h_score
+
+            node_city.append(next_city)
+            node_mask.append(visited | (1 << next_city))
+            node_parent.append(node)
+            heapq.heappush(pq, (f_score, new_g_score, len(node_city) - 1))
+
+    return best_tour, best_distance
+
+# Example usage
+def main():
+    # Sample distance matrix (symmetric, undirected graph)
+    graph = [
+        [0, 10, 15, 20, 25],
+        [10, 0, 35, 25, 30],
+        [15, 35, 0, 30, 20],
+        [20, 25, 30, 0, 15],
+        [25, 30, 20, 15, 0]
+    ]
+
+    # Run A* starting from city 0
+    tour, distance = astar_tsp(graph, start=0)
+
+    if tour:
+        print("A* TSP Tour:", " -> ".join(map(str, tour)))
+        print("Total Distance:", distance)
+    else:
+        print("No tour found")
+
+    # Same search with compact bitmask states and the 1-tree bound
+    tour, distance = astar_tsp_bitmask(graph, start=0, one_tree=True)
+    if tour:
+        print("Bitmask A* TSP Tour:", " -> ".join(map(str, tour)))
+        print("Total Distance:", distance)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
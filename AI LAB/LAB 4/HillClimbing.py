@@ -1,106 +1,151 @@
-import numpy as np
-from random import shuffle
-
-class State:
-    def __init__(self, tour: list, cost: float):
-        self.tour = tour  # Complete tour including start/end at city 0
-        self.cost = cost  # Total cost of the tour
-        self.parent = None
-
-    def __eq__(self, other):
-        return tuple(self.tour) == tuple(other.tour)
-
-    def __hash__(self):
-        return hash(tuple(self.tour))
-
-    def __str__(self):
-        return f"Tour: {self.tour}, Cost: {self.cost}"
-
-def compute_tour_cost(tour: list, dist_matrix: np.ndarray) -> float:
-    """Calculate the total cost of a tour."""
-    cost = 0.0
-    for i in range(len(tour) - 1):
-        cost += dist_matrix[tour[i], tour[i + 1]]
-    return cost
-
-def get_neighbors(state: State, dist_matrix: np.ndarray) -> list:
-    """Generate neighboring states using 2-opt swaps."""
-    neighbors = []
-    n = len(state.tour) - 1  # Exclude the final return to city 0
-    for i in range(1, n - 1):  # Start from 1 to skip city 0
-        for j in range(i + 1, n):
-            # Create new tour by swapping cities at positions i and j
-            new_tour = state.tour.copy()
-            new_tour[i], new_tour[j] = new_tour[j], new_tour[i]
-            cost = compute_tour_cost(new_tour, dist_matrix)
-            neighbor = State(new_tour, cost)
-            neighbor.parent = state
-            neighbors.append(neighbor)
-    return neighbors
-
-def generate_initial_tour(n: int) -> list:
-    """Generate a random initial tour starting and ending at city 0."""
-    tour = [0] + list(range(1, n)) + [0]
-    shuffle(tour[1:-1])  # Shuffle cities except start/end
-    return tour
-
-def hill_climbing_tsp(dist_matrix: np.ndarray) -> tuple:
-    """
-    Solve TSP using Hill Climbing with 2-opt swaps.
-    
-    Args:
-        dist_matrix: NxN numpy array of distances between cities.
-    
-    Returns:
-        Tuple of (optimal tour, total cost).
-    """
-    n = len(dist_matrix)
-    if n <= 1:
-        return [0], 0.0
-
-    # Generate initial random tour
-    initial_tour = generate_initial_tour(n)
-    initial_cost = compute_tour_cost(initial_tour, dist_matrix)
-    current_state = State(initial_tour, initial_cost)
-
-    print(f"Initial: {current_state}")
-
-    while True:
-        # Generate neighbors
-        neighbors = get_neighbors(current_state, dist_matrix)
-        if not neighbors:
-            break
-
-        # Find the best neighbor (lowest cost)
-        best_neighbor = min(neighbors, key=lambda x: x.cost)
-
-        # If no improvement, stop
-        if best_neighbor.cost >= current_state.cost:
-            print("No better neighbor found. Stopping.")
-            break
-
-        # Move to the best neighbor
-        current_state = best_neighbor
-        print(f"Improved: {current_state}")
-
-    print("Goal found!")
-    return current_state.tour, current_state.cost
-
-def print_solution(tour: list, cost: float):
-    """Print the solution path for TSP."""
-    if tour:
-        print("\nSolution Path:")
-        print(f"Tour: {tour}")
-        print(f"Total Cost: {cost}")
-
-# Example usage
-if __name__ == "__main__":
-    # Example distance matrix (symmetric TSP)
-    dist_matrix = np.array([
-        [0, 10, 15, 20],
-        [10, 0, 35, 25],
-        [15, 35, 0, 30],
-        [20, 25, 30, 0]
-    ])
-    tour, cost = hill_climbing_tsp(dist_matrix)
+import numpy as np
+from random import shuffle
+
+# Deltas above this are treated as zero so float noise cannot cycle the search
+EPSILON = 1e-9
+
+class State:
+    def __init__(self, tour: list, cost: float):
+        self.tour = tour  # Complete tour including start/end at city 0
+        self.cost = cost  # Total cost of the tour
+
+    def __eq__(self, other):
+        return tuple(self.tour) == tuple(other.tour)
+
+    def __hash__(self):
+        return hash(tuple(self.tour))
+
+    def __str__(self):
+        return f"Tour: {self.tour}, Cost: {self.cost}"
+
+def compute_tour_cost(tour: list, dist_matrix: np.ndarray) -> float:
+    """Calculate the total cost of a tour."""
+    cost = 0.0
+    for i in range(len(tour) - 1):
+        cost += dist_matrix[tour[i], tour[i + 1]]
+    return cost
+
+def swap_delta(tour: list, i: int, j: int, dist_matrix: np.ndarray) -> float:
+    """Cost change of swapping positions i < j, using only the edges it touches."""
+    a, b, c = tour[i - 1], tour[i], tour[i + 1]
+    d, e, f = tour[j - 1], tour[j], tour[j + 1]
+    if j == i + 1:  # Adjacent cities share the middle edge
+        removed = dist_matrix[a, b] + dist_matrix[b, e] + dist_matrix[e, f]
+        added = dist_matrix[a, e] + dist_matrix[e, b] + dist_matrix[b, f]
+    else:
+        removed = dist_matrix[a, b] + dist_matrix[b, c] + dist_matrix[d, e] + dist_matrix[e, f]
+        added = dist_matrix[a, e] + dist_matrix[e, c] + dist_matrix[d, b] + dist_matrix[b, f]
+    return added - removed
+
+def two_opt_delta(tour: list, i: int, j: int, dist_matrix: np.ndarray) -> float:
+    """Cost change of reversing tour[i..j] (symmetric distances)."""
+    a, b = tour[i - 1], tour[i]
+    c, d = tour[j], tour[j + 1]
+    return dist_matrix[a, c] + dist_matrix[b, d] - dist_matrix[a, b] - dist_matrix[c, d]
+
+def get_neighbors(state: State, dist_matrix: np.ndarray, move: str = 'swap'):
+    """Lazily yield neighboring moves as (i, j, delta) without building new tours."""
+    delta_fn = two_opt_delta if move == 'two_opt' else swap_delta
+    n = len(state.tour) - 1  # Exclude the final return to city 0
+    for i in range(1, n - 1):  # Start from 1 to skip city 0
+        for j in range(i + 1, n):
+            yield i, j, delta_fn(state.tour, i, j, dist_matrix)
+
+def select_move(moves, mode: str = 'best'):
+    """Pick the first improving move or the best one from a move stream."""
+    best = None
+    for found in moves:
+        if mode == 'first' and found[2] < -EPSILON:
+            return found
+        if best is None or found[2] < best[2]:
+            best = found
+    return best
+
+def apply_move(state: State, i: int, j: int, delta: float, move: str = 'swap') -> State:
+    """Apply the accepted move to the state's tour in place, touching only positions i..j."""
+    tour = state.tour
+    if move == 'two_opt':
+        tour[i:j + 1] = tour[i:j + 1][::-1]
+    else:
+        tour[i], tour[j] = tour[j], tour[i]
+    state.cost += delta
+    return state
+
+def generate_initial_tour(n: int) -> list:
+    """Generate a random initial tour starting and ending at city 0."""
+    cities = list(range(1, n))
+    shuffle(cities)  # Shuffling a slice like tour[1:-1] would only shuffle a copy
+    return [0] + cities + [0]
+
+def nearest_neighbor_tour(dist_matrix: np.ndarray) -> list:
+    """Greedy start tour: from city 0, always go to the closest unvisited city."""
+    dist_matrix = np.asarray(dist_matrix, dtype=float)
+    visited = np.zeros(len(dist_matrix), dtype=bool)
+    tour = [0]
+    visited[0] = True
+    for _ in range(len(dist_matrix) - 1):
+        city = int(np.where(visited, np.inf, dist_matrix[tour[-1]]).argmin())
+        visited[city] = True
+        tour.append(city)
+    return tour + [0]
+
+def hill_climbing_tsp(dist_matrix: np.ndarray, move: str = 'swap', mode: str = 'best',
+                      start: str = 'random') -> tuple:
+    """
+    Solve TSP using Hill Climbing with swap or 2-opt moves.
+    
+    Args:
+        dist_matrix: NxN numpy array of distances between cities.
+        move: 'swap' to exchange two cities, 'two_opt' to reverse a segment.
+        mode: 'best' for steepest ascent, 'first' to take the first improving move.
+        start: 'random' for a shuffled start tour, 'nearest_neighbor' for a greedy one.
+    
+    Returns:
+        Tuple of (optimal tour, total cost).
+    """
+    n = len(dist_matrix)
+    if n <= 1:
+        return [0], 0.0
+
+    # Generate initial tour
+    initial_tour = nearest_neighbor_tour(dist_matrix) if start == 'nearest_neighbor' else generate_initial_tour(n)
+    initial_cost = compute_tour_cost(initial_tour, dist_matrix)
+    current_state = State(initial_tour, initial_cost)
+
+    print(f"Initial: {current_state}")
+
+    while True:
+        # Stream neighbors and pick one without holding the whole neighborhood
+        found = select_move(get_neighbors(current_state, dist_matrix, move), mode)
+
+        # If no improvement, stop
+        if found is None or found[2] >= -EPSILON:
+            print("No better neighbor found. Stopping.")
+            break
+        i, j, delta = found
+
+        # Move to the best neighbor
+        current_state = apply_move(current_state, i, j, delta, move)
+        print(f"Improved: {current_state}")
+
+    print("Goal found!")
+    return current_state.tour, current_state.cost
+
+def print_solution(tour: list, cost: float):
+    """Print the solution path for TSP."""
+    if tour:
+        print("\nSolution Path:")
+        print(f"Tour: {tour}")
+        print(f"Total Cost: {cost}")
+
+# Example usage
+if __name__ == "__main__":
+    # Example distance matrix (symmetric TSP)
+    dist_matrix = np.array([
+        [0, 10, 15, 20],
+        [10, 0, 35, 25],
+        [15, 35, 0, 30],
+        [20, 25, 30, 0]
+    ])
+    tour, cost = hill_climbing_tsp(dist_matrix)
     print_solution(tour, cost)
\ No newline at end of file
@@ -1,7 +1,7 @@
-cities = [
-    (1, 1),  # City 0: Bottom-left
-    (3, 5),  # City 1: Mid-left, higher
-    (5, 8),  # City 2: Mid-center, top
-    (7, 3),  # City 3: Mid-right, mid
-    (2, 4)   # City 4: Mid-left, mid
-]
+cities = [
+    (1, 1),  # City 0: Bottom-left
+    (3, 5),  # City 1: Mid-left, higher
+    (5, 8),  # City 2: Mid-center, top
+    (7, 3),  # City 3: Mid-right, mid
+    (2, 4)   # City 4: Mid-left, mid
+]
@@ -0,0 +1,297 @@
+import mmap
+import os
+import random
+import time
+import zlib
+from collections import deque
+
+import numpy as np
+
+from puzzle import blank_moves, cell_distances, decode, encode, goal_positions, neighbors
+
+PDB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb")
+UNSEEN = 255
+
+# Disjoint tile groups per board size (for the standard goal 1..n, blank last).
+# A database has cells^len(group) one-byte entries.
+PARTITIONS = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 5, 6, 9, 13), (2, 3, 4, 7, 8), (10, 11, 12, 14, 15)),
+    5: ((1, 2, 6, 7), (3, 4, 8, 9), (5, 10, 15, 20), (11, 12, 16, 17), (13, 14, 18, 19), (21, 22, 23, 24)),
+}
+
+
+def standard_goal(size):
+    """1, 2, ..., n with the blank in the last cell."""
+    return tuple(range(1, size * size)) + (0,)
+
+
+def is_solvable(cells, goal_cells, size):
+    """Whether cells can reach goal_cells; blank moves preserve a parity invariant."""
+    def parity(tiles):
+        order = [t for t in tiles if t]
+        inversions = sum(1 for i in range(len(order)) for j in range(i + 1, len(order)) if order[i] > order[j])
+        if size % 2 == 0:  # On even widths a vertical blank move also changes the blank's row parity
+            inversions += tiles.index(0) // size
+        return inversions % 2
+
+    # Relabel so the goal reads 1..n, then compare with the standard goal
+    rank = {tile: i + 1 for i, tile in enumerate(t for t in goal_cells if t)}
+    rank[0] = 0
+    relabelled = [rank[t] for t in cells]
+    relabelled_goal = [rank[t] for t in goal_cells]
+    return parity(relabelled) == parity(relabelled_goal)
+
+
+def build_pattern_database(size, tiles, goal_cells):
+    """Fewest moves of the pattern tiles to reach their goal cells, for every placement.
+
+    Backward breadth-first search from the goal placement over all placements
+    of the pattern tiles. Only moves of pattern tiles are counted and other
+    tiles are ignored, so a move may go to any free neighboring cell; with
+    disjoint groups every real move counts in at most one database and their
+    sums stay admissible. Entry index = sum(cell of tiles[i] * cells^i).
+    """
+    n = size * size
+    k = len(tiles)
+    weights = n ** np.arange(k, dtype=np.int64)
+    table = np.full(n ** k, UNSEEN, dtype=np.uint8)
+    goal_pos = goal_positions(goal_cells)
+    frontier = np.array([sum(goal_pos[t] * int(w) for t, w in zip(tiles, weights))], dtype=np.int64)
+    table[frontier] = 0
+    depth = 0
+    while len(frontier):
+        digits = frontier[:, None] // weights % n  # Cell of every pattern tile
+        rows, cols = digits // size, digits % size
+        found = []
+        for i in range(k):
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                r, c = rows[:, i] + dr, cols[:, i] + dc
+                valid = (r >= 0) & (r < size) & (c >= 0) & (c < size)
+                target = r * size + c
+                for j in range(k):
+                    if j != i:
+                        valid &= digits[:, j] != target
+                found.append(frontier[valid] + (target[valid] - digits[valid, i]) * weights[i])
+        frontier = np.unique(np.concatenate(found))
+        frontier = frontier[table[frontier] == UNSEEN]
+        depth += 1
+        table[frontier] = depth
+    return table
+
+
+def pattern_database_path(size, tiles, goal_cells):
+    goal_tag = format(zlib.crc32(bytes(goal_cells)), "08x")
+    return os.path.join(PDB_DIR, f"{size}x{size}_{'-'.join(map(str, tiles))}_{goal_tag}.bin")
+
+
+def load_pattern_database(size, tiles, goal_cells):
+    """Memory-map a pattern database read-only, building and saving it on first use."""
+    path = pattern_database_path(size, tiles, goal_cells)
+    if not os.path.exists(path):
+        os.makedirs(PDB_DIR, exist_ok=True)
+        build_pattern_database(size, tiles, goal_cells).tofile(path)
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ManhattanHeuristic:
+    """Sum of tile distances, updated by the moved tile only."""
+
+    def __init__(self, size, goal_cells):
+        self.dist = cell_distances(size)
+        self.goal_pos = goal_positions(goal_cells)
+
+    def reset(self, cells):
+        self.h = sum(self.dist[cell][self.goal_pos[tile]] for cell, tile in enumerate(cells) if tile)
+        return self.h
+
+    def move(self, tile, src, dst):
+        target = self.goal_pos[tile]
+        self.h += self.dist[dst][target] - self.dist[src][target]
+        return self.h
+
+
+class LinearConflictHeuristic(ManhattanHeuristic):
+    """Manhattan distance plus two moves per tile that must leave its row or column.
+
+    Within a line, tiles that belong to that line but sit in reversed order
+    cannot pass each other: all but a longest in-order subsequence have to
+    step aside and back. Needs no tables, so it is the fallback when pattern
+    databases are too big to build.
+    """
+
+    def __init__(self, size, goal_cells):
+        super().__init__(size, goal_cells)
+        self.size = size
+
+    def reset(self, cells):
+        self.cells = cells  # Shared with the search, which moves tiles before calling move()
+        super().reset(cells)
+        self.row_conflicts = [self.line_conflicts(line, True) for line in range(self.size)]
+        self.col_conflicts = [self.line_conflicts(line, False) for line in range(self.size)]
+        self.extra = 2 * (sum(self.row_conflicts) + sum(self.col_conflicts))
+        return self.h + self.extra
+
+    def move(self, tile, src, dst):
+        super().move(tile, src, dst)
+        # A sideways move only reorders the two columns involved, a vertical one the two rows
+        horizontal = src // self.size == dst // self.size
+        counts = self.col_conflicts if horizontal else self.row_conflicts
+        for cell in (src, dst):
+            line = cell % self.size if horizontal else cell // self.size
+            new = self.line_conflicts(line, not horizontal)
+            self.extra += 2 * (new - counts[line])
+            counts[line] = new
+        return self.h + self.extra
+
+    def line_conflicts(self, line, is_row):
+        """Tiles of one row or column that must step out of it to let the others pass."""
+        size, goal_pos = self.size, self.goal_pos
+        if is_row:
+            order = [goal_pos[t] % size for t in self.cells[line * size:(line + 1) * size]
+                     if t and goal_pos[t] // size == line]
+        else:
+            order = [goal_pos[t] // size for t in self.cells[line::size] if t and goal_pos[t] % size == line]
+        return len(order) - longest_increasing(order)
+
+
+def longest_increasing(values):
+    """Length of the longest strictly increasing subsequence (values are short lines)."""
+    best = [1] * len(values)
+    for i in range(len(values)):
+        for j in range(i):
+            if values[j] < values[i] and best[j] + 1 > best[i]:
+                best[i] = best[j] + 1
+    return max(best, default=0)
+
+
+class PatternDatabaseHeuristic:
+    """Sum of additive disjoint pattern databases, one byte lookup per group.
+
+    Each group's database index is kept up to date as tiles move, so a move
+    costs one index adjustment and two lookups.
+    """
+
+    def __init__(self, size, goal_cells, partition=None):
+        self.size = size
+        self.partition = partition or PARTITIONS[size]
+        self.databases = [load_pattern_database(size, tiles, goal_cells) for tiles in self.partition]
+        self.group_of = {}  # tile -> (group, index weight)
+        for g, tiles in enumerate(self.partition):
+            for i, tile in enumerate(tiles):
+                self.group_of[tile] = (g, (size * size) ** i)
+
+    def reset(self, cells):
+        self.index = [0] * len(self.partition)
+        for cell, tile in enumerate(cells):
+            if tile in self.group_of:
+                g, weight = self.group_of[tile]
+                self.index[g] += cell * weight
+        self.h = sum(db[i] for db, i in zip(self.databases, self.index))
+        return self.h
+
+    def move(self, tile, src, dst):
+        if tile in self.group_of:
+            g, weight = self.group_of[tile]
+            db, old = self.databases[g], self.index[g]
+            self.index[g] = new = old + (dst - src) * weight
+            self.h += db[new] - db[old]
+        return self.h
+
+
+HEURISTICS = {
+    'manhattan': ManhattanHeuristic,
+    'linear_conflict': LinearConflictHeuristic,
+    'pdb': PatternDatabaseHeuristic,
+}
+
+
+def ida_star(start, goal=None, heuristic='pdb'):
+    """Optimal N-puzzle solution by iterative-deepening A*.
+
+    start and goal are flat tuples (blank = 0) of a 3x3, 4x4 or 5x5 board;
+    goal defaults to 1..n with the blank last. Returns (tiles slid in order,
+    nodes expanded), or (None, 0) if the goal is unreachable.
+    """
+    cells = list(start)
+    size = int(round(len(cells) ** 0.5))
+    goal = tuple(goal) if goal is not None else standard_goal(size)
+    if not is_solvable(cells, goal, size):
+        return None, 0
+
+    heur = HEURISTICS[heuristic](size, goal)
+    moves_from = blank_moves(size)
+    path = []
+    nodes = 0
+
+    def search(blank, g, bound, h, prev):
+        nonlocal nodes
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0:  # Every heuristic here is zero only on the goal
+            return True
+        nodes += 1
+        minimum = float('inf')
+        for cell in moves_from[blank]:
+            if cell == prev:  # Never undo the previous move
+                continue
+            tile = cells[cell]
+            cells[blank], cells[cell] = tile, 0
+            path.append(tile)
+            result = search(cell, g + 1, bound, heur.move(tile, cell, blank), blank)
+            if result is True:
+                return True
+            path.pop()
+            cells[cell], cells[blank] = tile, 0  # Restore the board before the heuristic recounts it
+            heur.move(tile, blank, cell)
+            minimum = min(minimum, result)
+        return minimum
+
+    h = heur.reset(cells)
+    bound = h
+    while True:
+        result = search(cells.index(0), 0, bound, h, -1)
+        if result is True:
+            return path, nodes
+        bound = result
+
+
+def bfs_distances(size, goal_cells):
+    """Exact distance to the goal of every reachable packed state, by breadth-first search.
+
+    Only practical for the 8-puzzle (181,440 states); used to check that
+    ida_star() returns shortest solutions.
+    """
+    goal = encode(goal_cells, size)
+    dist = {goal: 0}
+    queue = deque([(goal, goal_cells.index(0))])
+    while queue:
+        state, blank = queue.popleft()
+        for neighbor, cell, _ in neighbors(state, blank, size):
+            if neighbor not in dist:
+                dist[neighbor] = dist[state] + 1
+                queue.append((neighbor, cell))
+    return dist
+
+
+# Example usage
+if __name__ == "__main__":
+    puzzles = [
+        ("8-puzzle", (3, 4, 6, 1, 0, 8, 2, 5, 7), ('linear_conflict', 'pdb')),
+        ("15-puzzle", (9, 6, 0, 4, 2, 1, 3, 8, 13, 11, 15, 10, 5, 14, 12, 7), ('pdb',)),
+    ]
+    for name, start, heuristics in puzzles:
+        for heuristic in heuristics:
+            start_time = time.time()
+            path, nodes = ida_star(start, heuristic=heuristic)
+            print(f"{name} ({heuristic}): {len(path)} moves, {nodes} nodes, {time.time() - start_time:.2f}s")
+
+    # Every heuristic must give shortest solutions on random 8-puzzles
+    exact = bfs_distances(3, standard_goal(3))
+    states = random.Random(0).sample(sorted(exact), 300)
+    for heuristic in HEURISTICS:
+        wrong = sum(len(ida_star(decode(state, 3), heuristic=heuristic)[0]) != exact[state] for state in states)
+        print(f"{heuristic}: {wrong} of {len(states)} random 8-puzzles solved suboptimally")
+        assert wrong == 0
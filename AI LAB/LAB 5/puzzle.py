@@ -0,0 +1,176 @@
+from functools import lru_cache
+
+from symmetry import symmetries
+
+# A state is one integer holding a tile number per cell, cell 0 in the
+# highest bits and the last cell in the lowest; the blank is tile 0. Moving
+# the blank is two XORs instead of copying a grid, states hash as plain
+# ints, and comparing two states compares their grids cell by cell.
+
+# Lookup tables over packed states cover chunks of at most this many bits
+CHUNK_BITS = 12
+
+
+@lru_cache(maxsize=None)
+def bits_per_cell(size):
+    return (size * size - 1).bit_length()
+
+
+@lru_cache(maxsize=None)
+def cell_shifts(size):
+    """Bit offset of every cell in a packed state."""
+    bits = bits_per_cell(size)
+    return tuple(bits * (size * size - 1 - cell) for cell in range(size * size))
+
+
+@lru_cache(maxsize=None)
+def blank_moves(size):
+    """Cells the blank can move to from each cell of a size x size board."""
+    moves = []
+    for cell in range(size * size):
+        r, c = divmod(cell, size)
+        moves.append(tuple(nr * size + nc for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                           if 0 <= nr < size and 0 <= nc < size))
+    return tuple(moves)
+
+
+@lru_cache(maxsize=None)
+def cell_distances(size):
+    """Manhattan distance between every pair of cells."""
+    return tuple(tuple(abs(a // size - b // size) + abs(a % size - b % size) for b in range(size * size))
+                 for a in range(size * size))
+
+
+def encode(cells, size):
+    """Pack a flat tuple of tiles into a state."""
+    state = 0
+    for shift, tile in zip(cell_shifts(size), cells):
+        state |= tile << shift
+    return state
+
+
+def decode(state, size):
+    """Unpack a state into a flat tuple of tiles."""
+    mask = (1 << bits_per_cell(size)) - 1
+    return tuple(state >> shift & mask for shift in cell_shifts(size))
+
+
+def goal_positions(goal_cells):
+    """goal_pos[tile] is the cell the tile belongs on."""
+    goal_pos = [0] * len(goal_cells)
+    for cell, tile in enumerate(goal_cells):
+        goal_pos[tile] = cell
+    return goal_pos
+
+
+def manhattan(cells, goal_pos, size):
+    """Sum of the tiles' distances to their goal cells, by table lookup."""
+    dist = cell_distances(size)
+    return sum(dist[cell][goal_pos[tile]] for cell, tile in enumerate(cells) if tile)
+
+
+def misplaced(cells, goal_cells):
+    return sum(1 for tile, goal_tile in zip(cells, goal_cells) if tile and tile != goal_tile)
+
+
+def neighbors(state, blank, size):
+    """Yield (next state, new blank cell, moved tile) for every blank move."""
+    mask = (1 << bits_per_cell(size)) - 1
+    shifts = cell_shifts(size)
+    for cell in blank_moves(size)[blank]:
+        tile = state >> shifts[cell] & mask
+        yield state ^ (tile << shifts[cell]) ^ (tile << shifts[blank]), cell, tile
+
+
+def scored_neighbors(state, blank, distance, wrong, goal_cells, goal_pos, size):
+    """Neighbors with their Manhattan distance and misplaced count, updated incrementally.
+
+    A blank move only relocates one tile, so both scores change by that
+    tile's before/after difference: O(1) per neighbor instead of O(n^2).
+    """
+    dist = cell_distances(size)
+    for neighbor, cell, tile in neighbors(state, blank, size):
+        target = goal_pos[tile]
+        yield (neighbor, cell,
+               distance - dist[cell][target] + dist[blank][target],
+               wrong - (goal_cells[cell] != tile) + (goal_cells[blank] != tile))
+
+
+@lru_cache(maxsize=None)
+def goal_symmetries(goal_cells, size):
+    """(symmetry index, perm, relabel) for every board symmetry that preserves reaching goal_cells.
+
+    A board symmetry that keeps the goal's blank cell fixed, followed by
+    relabelling tiles so the goal maps onto itself, preserves moves and
+    Manhattan distances. The transformed board holds relabel[cells[perm[i]]]
+    at cell i.
+    """
+    goal_pos = goal_positions(goal_cells)
+    tables = []
+    for t, (perm, image) in enumerate(symmetries(size, size)):
+        if image[goal_pos[0]] == goal_pos[0]:
+            relabel = tuple(goal_cells[image[goal_pos[tile]]] for tile in range(len(goal_cells)))
+            tables.append((t, perm, relabel))
+    return tuple(tables)
+
+
+@lru_cache(maxsize=None)
+def canonicalizer(goal_cells, size):
+    """canonical(cells) for one goal; the symmetry tables are built once per goal."""
+    tables = goal_symmetries(tuple(goal_cells), size)
+
+    def canonical(cells):
+        return min((tuple(relabel[cells[i]] for i in perm), t) for t, perm, relabel in tables)
+    return canonical
+
+
+@lru_cache(maxsize=None)
+def state_canonicalizer(goal_cells, size):
+    """canonical(state) -> (smallest equivalent packed state, symmetry index) for one goal.
+
+    The same representative as canonicalizer() gives, computed on the packed
+    int: for every symmetry, each CHUNK_BITS-wide chunk of cells maps through
+    a lookup table straight to its relabelled tiles at their new cells, so a
+    state costs a few lookups and ORs per symmetry and is never decoded.
+    """
+    n = size * size
+    bits = bits_per_cell(size)
+    shifts = cell_shifts(size)
+    per_chunk = max(1, CHUNK_BITS // bits)
+    tables = []
+    for t, perm, relabel in goal_symmetries(tuple(goal_cells), size):
+        if t == 0:  # The identity leaves the state as it is
+            continue
+        moved_to = [0] * n
+        for cell, source in enumerate(perm):
+            moved_to[source] = cell
+        chunks = []
+        for first in range(0, n, per_chunk):
+            cells = range(first, min(first + per_chunk, n))
+            table = [0]
+            for cell in cells:  # Earlier cells are the higher bits of a chunk
+                placed = [relabel[tile] << shifts[moved_to[cell]] if tile < n else 0 for tile in range(1 << bits)]
+                table = [high | low for high in table for low in placed]
+            chunks.append((shifts[cells[-1]], (1 << (bits * len(cells))) - 1, table))
+        tables.append((t, chunks))
+
+    def canonical(state):
+        best, best_t = state, 0
+        for t, chunks in tables:
+            image = 0
+            for shift, mask, table in chunks:
+                image |= table[state >> shift & mask]
+            if image < best:
+                best, best_t = image, t
+        return best, best_t
+    return canonical
+
+
+def canonical_state(cells, goal_cells, size):
+    """Representative of the states equivalent to cells with respect to reaching the goal.
+
+    Returns the smallest flat tuple reachable by a symmetry from
+    goal_symmetries() and the index of the symmetry that produced it.
+    Searches canonicalizing many states should call canonicalizer() once.
+    """
+    return canonicalizer(tuple(goal_cells), size)(cells)
@@ -1,110 +1,194 @@
-class TicTacToe:
-    def __init__(self):
-        self.board = [[' ' for _ in range(3)] for _ in range(3)]
-        self.current_player = 'X'
-
-    def print_board(self):
-        for row in self.board:
-            print('|'.join(row))
-            print('-' * 5)
-        print()
-
-    def is_winner(self, player):
-        # Check rows
-        for row in self.board:
-            if all(cell == player for cell in row):
-                return True
-        # Check columns
-        for col in range(3):
-            if all(self.board[row][col] == player for row in range(3)):
-                return True
-        # Check diagonals
-        if all(self.board[i][i] == player for i in range(3)):
-            return True
-        if all(self.board[i][2-i] == player for i in range(3)):
-            return True
-        return False
-
-    def is_draw(self):
-        return all(cell != ' ' for row in self.board for cell in row) and not self.is_winner('X') and not self.is_winner('O')
-
-    def is_terminal(self):
-        return self.is_winner('X') or self.is_winner('O') or self.is_draw()
-
-    def get_empty_cells(self):
-        return [(i, j) for i in range(3) for j in range(3) if self.board[i][j] == ' ']
-
-    def make_move(self, row, col, player):
-        if self.board[row][col] == ' ':
-            self.board[row][col] = player
-            return True
-        return False
-
-    def undo_move(self, row, col):
-        self.board[row][col] = ' '
-
-def minimax(game, player):
-    """Minimax algorithm for Tic-Tac-Toe."""
-    if game.is_winner('X'):
-        return 1, None
-    if game.is_winner('O'):
-        return -1, None
-    if game.is_draw():
-        return 0, None
-
-    if player == 'X':  # MAX player
-        best_score = float('-inf')
-        best_move = None
-        for row, col in game.get_empty_cells():
-            game.make_move(row, col, 'X')
-            score, _ = minimax(game, 'O')
-            game.undo_move(row, col)
-            if score > best_score:
-                best_score = score
-                best_move = (row, col)
-        return best_score, best_move
-    else:  # MIN player
-        best_score = float('inf')
-        best_move = None
-        for row, col in game.get_empty_cells():
-            game.make_move(row, col, 'O')
-            score, _ = minimax(game, 'X')
-            game.undo_move(row, col)
-            if score < best_score:
-                best_score = score
-                best_move = (row, col)
-        return best_score, best_move
-
-def play_game():
-    """Play Tic-Tac-Toe: Human (O) vs AI (X)."""
-    game = TicTacToe()
-    print("Tic-Tac-Toe: You are O, AI is X. Enter row (0-2) and col (0-2).")
-    game.print_board()
-
-    while not game.is_terminal():
-        if game.current_player == 'X':
-            print("AI's turn (X)...")
-            _, move = minimax(game, 'X')
-            if move:
-                row, col = move
-                game.make_move(row, col, 'X')
-                print(f"AI places X at ({row}, {col})")
-            game.current_player = 'O'
-        else:
-            row = int(input("Enter row (0-2): "))
-            col = int(input("Enter col (0-2): "))
-            if not game.make_move(row, col, 'O'):
-                print("Invalid move. Try again.")
-                continue
-            game.current_player = 'X'
-        game.print_board()
-
-    if game.is_winner('X'):
-        print("AI (X) wins!")
-    elif game.is_winner('O'):
-        print("You (O) win!")
-    else:
-        print("It's a draw!")
-
-if __name__ == "__main__":
+import random
+
+from symmetry import from_canonical, symmetries, to_canonical
+
+class TicTacToe:
+    def __init__(self):
+        self.board = [[' ' for _ in range(3)] for _ in range(3)]
+        self.current_player = 'X'
+        self.rows = self.cols = 3
+        self.size = 9
+        # Zobrist hash of the board seen through each symmetry, updated on every move
+        self.hashes = [0] * len(SYMMETRIES)
+        self.moves_made = 0
+
+    def print_board(self):
+        for row in self.board:
+            print('|'.join(row))
+            print('-' * 5)
+        print()
+
+    def is_winner(self, player):
+        # Check rows
+        for row in self.board:
+            if all(cell == player for cell in row):
+                return True
+        # Check columns
+        for col in range(3):
+            if all(self.board[row][col] == player for row in range(3)):
+                return True
+        # Check diagonals
+        if all(self.board[i][i] == player for i in range(3)):
+            return True
+        if all(self.board[i][2-i] == player for i in range(3)):
+            return True
+        return False
+
+    def is_draw(self):
+        return all(cell != ' ' for row in self.board for cell in row) and not self.is_winner('X') and not self.is_winner('O')
+
+    def is_terminal(self):
+        return self.is_winner('X') or self.is_winner('O') or self.is_draw()
+
+    def get_empty_cells(self):
+        return [(i, j) for i in range(3) for j in range(3) if self.board[i][j] == ' ']
+
+    def ordered_moves(self):
+        return [(i, j) for i, j in MOVE_ORDER if self.board[i][j] == ' ']
+
+    def make_move(self, row, col, player):
+        if self.board[row][col] == ' ':
+            self.board[row][col] = player
+            self._toggle_hashes(row * 3 + col, player)
+            self.moves_made += 1
+            return True
+        return False
+
+    def undo_move(self, row, col):
+        self._toggle_hashes(row * 3 + col, self.board[row][col])
+        self.moves_made -= 1
+        self.board[row][col] = ' '
+
+    def _toggle_hashes(self, cell, player):
+        for t, (_, image) in enumerate(SYMMETRIES):
+            self.hashes[t] ^= ZOBRIST[image[cell], player]
+
+    def wins_through(self, row, col, player):
+        """Check only the lines through the last move instead of the whole board."""
+        b = self.board
+        if all(b[row][j] == player for j in range(3)) or all(b[i][col] == player for i in range(3)):
+            return True
+        if row == col and all(b[i][i] == player for i in range(3)):
+            return True
+        return row + col == 2 and all(b[i][2-i] == player for i in range(3))
+
+# Zobrist keys: a random 64-bit number per (cell, player), plus one per side to move
+ZOBRIST = {(cell, p): random.getrandbits(64) for cell in range(9) for p in 'XO'}
+SIDE_TO_MOVE = {'X': random.getrandbits(64), 'O': random.getrandbits(64)}
+SYMMETRIES = symmetries(3, 3)
+# Move ordering: center, then corners, then edges
+MOVE_ORDER = [(1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1)]
+EXACT, LOWER, UPPER = 0, 1, 2
+# canonical hash: (score, bound flag, best move); kept across moves and games
+transposition_table = {}
+
+def minimax(game, player):
+    """Minimax algorithm for Tic-Tac-Toe with alpha-beta pruning and a transposition table."""
+    if game.is_winner('X'):
+        return 1, None
+    if game.is_winner('O'):
+        return -1, None
+    if game.is_draw():
+        return 0, None
+    return alphabeta(game, player, -float('inf'), float('inf'))
+
+def alphabeta(game, player, alpha, beta):
+    """Alpha-beta search below a non-terminal position.
+
+    Works on any game with the TicTacToe move API, including the m,n,k
+    bitboard engine in mnk.py.
+    """
+    # Rotated and reflected positions share one entry, keyed by the smallest
+    # of their hashes; moves are stored as seen through that symmetry
+    key, sym = min((h, t) for t, h in enumerate(game.hashes))
+    key ^= SIDE_TO_MOVE[player]
+    alpha_orig, beta_orig = alpha, beta
+    tt_move = None
+    entry = transposition_table.get(key)
+    if entry:
+        score, flag, tt_move = entry
+        tt_move = from_canonical(tt_move, sym, game.rows, game.cols) if tt_move else None
+        if flag == EXACT:
+            return score, tt_move
+        if flag == LOWER:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        if alpha >= beta:
+            return score, tt_move
+
+    # Try the stored best move first, then the game's static order
+    moves = game.ordered_moves()
+    if tt_move in moves:
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
+    if not moves:
+        return 0, None
+
+    opponent = 'O' if player == 'X' else 'X'
+    best_score = -float('inf') if player == 'X' else float('inf')  # X is MAX, O is MIN
+    best_move = None
+    for row, col in moves:
+        game.make_move(row, col, player)
+        if game.wins_through(row, col, player):
+            score = 1 if player == 'X' else -1
+        elif game.moves_made == game.size:
+            score = 0
+        else:
+            score, _ = alphabeta(game, opponent, alpha, beta)
+        game.undo_move(row, col)
+
+        if player == 'X':
+            if score > best_score:
+                best_score, best_move = score, (row, col)
+            alpha = max(alpha, score)
+        else:
+            if score < best_score:
+                best_score, best_move = score, (row, col)
+            beta = min(beta, score)
+        if alpha >= beta:
+            break
+
+    if best_score <= alpha_orig:
+        flag = UPPER
+    elif best_score >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    stored_move = to_canonical(best_move, sym, game.rows, game.cols) if best_move else None
+    transposition_table[key] = (best_score, flag, stored_move)
+    return best_score, best_move
+
+def play_game():
+    """Play Tic-Tac-Toe: Human (O) vs AI (X)."""
+    game = TicTacToe()
+    print("Tic-Tac-Toe: You are O, AI is X. Enter row (0-2) and col (0-2).")
+    game.print_board()
+
+    while not game.is_terminal():
+        if game.current_player == 'X':
+            print("AI's turn (X)...")
+            _, move = minimax(game, 'X')
+            if move:
+                row, col = move
+                game.make_move(row, col, 'X')
+                print(f"AI places X at ({row}, {col})")
+            game.current_player = 'O'
+        else:
+            row = int(input("Enter row (0-2): "))
+            col = int(input("Enter col (0-2): "))
+            if not game.make_move(row, col, 'O'):
+                print("Invalid move. Try again.")
+                continue
+            game.current_player = 'X'
+        game.print_board()
+
+    if game.is_winner('X'):
+        print("AI (X) wins!")
+    elif game.is_winner('O'):
+        print("You (O) win!")
+    else:
+        print("It's a draw!")
+
+if __name__ == "__main__":
     play_game()
\ No newline at end of file
@@ -1,190 +1,342 @@
-import asyncio
-import pygame
-import platform
-from math import inf
-
-# Pygame setup
-pygame.init()
-WIDTH, HEIGHT = 300, 300
-CELL_SIZE = WIDTH // 3
-LINE_WIDTH = 5
-FONT_SIZE = 40
-FPS = 60
-
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-
-# Screen setup
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Tic-Tac-Toe with Minimax")
-font = pygame.font.SysFont("arial", FONT_SIZE)
-
-class TicTacToe:
-    def __init__(self):
-        self.board = [[' ' for _ in range(3)] for _ in range(3)]
-        self.current_player = 'X'
-        self.game_over = False
-        self.winner = None
-        self.message = ""
-
-    def draw_board(self):
-        screen.fill(WHITE)
-        # Draw grid lines
-        for i in range(1, 3):
-            pygame.draw.line(screen, BLACK, (i * CELL_SIZE, 0), (i * CELL_SIZE, HEIGHT), LINE_WIDTH)
-            pygame.draw.line(screen, BLACK, (0, i * CELL_SIZE), (WIDTH, i * CELL_SIZE), LINE_WIDTH)
-        # Draw X's and O's
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] == 'X':
-                    self.draw_x(i, j)
-                elif self.board[i][j] == 'O':
-                    self.draw_o(i, j)
-        # Draw game-over message
-        if self.game_over:
-            text = font.render(self.message, True, BLACK)
-            text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            screen.blit(text, text_rect)
-        pygame.display.flip()
-
-    def draw_x(self, row, col):
-        margin = CELL_SIZE // 4
-        x = col * CELL_SIZE + margin
-        y = row * CELL_SIZE + margin
-        pygame.draw.line(screen, RED, (x, y), (x + CELL_SIZE - 2 * margin, y + CELL_SIZE - 2 * margin), LINE_WIDTH)
-        pygame.draw.line(screen, RED, (x, y + CELL_SIZE - 2 * margin), (x + CELL_SIZE - 2 * margin, y), LINE_WIDTH)
-
-    def draw_o(self, row, col):
-        margin = CELL_SIZE // 4
-        center_x = col * CELL_SIZE + CELL_SIZE // 2
-        center_y = row * CELL_SIZE + CELL_SIZE // 2
-        radius = CELL_SIZE // 2 - margin
-        pygame.draw.circle(screen, BLUE, (center_x, center_y), radius, LINE_WIDTH)
-
-    def is_winner(self, player):
-        # Check rows
-        for row in self.board:
-            if all(cell == player for cell in row):
-                return True
-        # Check columns
-        for col in range(3):
-            if all(self.board[row][col] == player for row in range(3)):
-                return True
-        # Check diagonals
-        if all(self.board[i][i] == player for i in range(3)):
-            return True
-        if all(self.board[i][2-i] == player for i in range(3)):
-            return True
-        return False
-
-    def is_draw(self):
-        return all(cell != ' ' for row in self.board for cell in row) and not self.is_winner('X') and not self.is_winner('O')
-
-    def is_terminal(self):
-        return self.is_winner('X') or self.is_winner('O') or self.is_draw()
-
-    def get_empty_cells(self):
-        return [(i, j) for i in range(3) for j in range(3) if self.board[i][j] == ' ']
-
-    def make_move(self, row, col, player):
-        if self.board[row][col] == ' ':
-            self.board[row][col] = player
-            return True
-        return False
-
-    def undo_move(self, row, col):
-        self.board[row][col] = ' '
-
-def minimax(game, player):
-    """Minimax algorithm for Tic-Tac-Toe."""
-    if game.is_winner('X'):
-        return 1, None
-    if game.is_winner('O'):
-        return -1, None
-    if game.is_draw():
-        return 0, None
-
-    if player == 'X':  # MAX player
-        best_score = -inf
-        best_move = None
-        for row, col in game.get_empty_cells():
-            game.make_move(row, col, 'X')
-            score, _ = minimax(game, 'O')
-            game.undo_move(row, col)
-            if score > best_score:
-                best_score = score
-                best_move = (row, col)
-        return best_score, best_move
-    else:  # MIN player
-        best_score = inf
-        best_move = None
-        for row, col in game.get_empty_cells():
-            game.make_move(row, col, 'O')
-            score, _ = minimax(game, 'X')
-            game.undo_move(row, col)
-            if score < best_score:
-                best_score = score
-                best_move = (row, col)
-        return best_score, best_move
-
-async def main():
-    game = TicTacToe()
-    game.draw_board()
-
-    while True:
-        if game.game_over:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
-                    game = TicTacToe()  # Restart game
-                    game.draw_board()
-            await asyncio.sleep(1.0 / FPS)
-            continue
-
-        if game.current_player == 'X':
-            # AI's turn
-            _, move = minimax(game, 'X')
-            if move:
-                row, col = move
-                game.make_move(row, col, 'X')
-                game.current_player = 'O'
-                game.draw_board()
-                # Check game status
-                if game.is_winner('X'):
-                    game.game_over = True
-                    game.message = "AI (X) Wins! Press R to Restart"
-                elif game.is_draw():
-                    game.game_over = True
-                    game.message = "Draw! Press R to Restart"
-        else:
-            # Human's turn
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-                if event.type == pygame.MOUSEBUTTONDOWN and not game.game_over:
-                    x, y = pygame.mouse.get_pos()
-                    row, col = y // CELL_SIZE, x // CELL_SIZE
-                    if game.make_move(row, col, 'O'):
-                        game.current_player = 'X'
-                        game.draw_board()
-                        # Check game status
-                        if game.is_winner('O'):
-                            game.game_over = True
-                            game.message = "You (O) Win! Press R to Restart"
-                        elif game.is_draw():
-                            game.game_over = True
-                            game.message = "Draw! Press R to Restart"
-
-        await asyncio.sleep(1.0 / FPS)
-
-if platform.system() == "Emscripten":
-    asyncio.ensure_future(main())
-else:
-    if __name__ == "__main__":
+import asyncio
+import pygame
+import platform
+import random
+import time
+from math import inf
+
+from opening_book import book_move, load_book
+from symmetry import from_canonical, symmetries, to_canonical
+
+# Pygame setup
+pygame.init()
+WIDTH, HEIGHT = 300, 300
+CELL_SIZE = WIDTH // 3
+LINE_WIDTH = 5
+FONT_SIZE = 40
+FPS = 60
+AI_TIME_BUDGET = 1.0  # Seconds the AI may think per move
+
+# Perfect-play opening book, memory-mapped; None falls back to searching every move
+try:
+    OPENING_BOOK = load_book()
+except OSError:
+    OPENING_BOOK = None
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+# Screen setup
+screen = pygame.display.set_mode((WIDTH, HEIGHT))
+pygame.display.set_caption("Tic-Tac-Toe with Minimax")
+font = pygame.font.SysFont("arial", FONT_SIZE)
+
+class TicTacToe:
+    def __init__(self):
+        self.board = [[' ' for _ in range(3)] for _ in range(3)]
+        self.current_player = 'X'
+        self.rows = self.cols = 3
+        self.size = 9
+        # Zobrist hash of the board seen through each symmetry, updated on every move
+        self.hashes = [0] * len(SYMMETRIES)
+        self.moves_made = 0
+        self.game_over = False
+        self.winner = None
+        self.message = ""
+
+    def draw_board(self):
+        screen.fill(WHITE)
+        # Draw grid lines
+        for i in range(1, 3):
+            pygame.draw.line(screen, BLACK, (i * CELL_SIZE, 0), (i * CELL_SIZE, HEIGHT), LINE_WIDTH)
+            pygame.draw.line(screen, BLACK, (0, i * CELL_SIZE), (WIDTH, i * CELL_SIZE), LINE_WIDTH)
+        # Draw X's and O's
+        for i in range(3):
+            for j in range(3):
+                if self.board[i][j] == 'X':
+                    self.draw_x(i, j)
+                elif self.board[i][j] == 'O':
+                    self.draw_o(i, j)
+        # Draw game-over message
+        if self.game_over:
+            text = font.render(self.message, True, BLACK)
+            text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+            screen.blit(text, text_rect)
+        pygame.display.flip()
+
+    def draw_x(self, row, col):
+        margin = CELL_SIZE // 4
+        x = col * CELL_SIZE + margin
+        y = row * CELL_SIZE + margin
+        pygame.draw.line(screen, RED, (x, y), (x + CELL_SIZE - 2 * margin, y + CELL_SIZE - 2 * margin), LINE_WIDTH)
+        pygame.draw.line(screen, RED, (x, y + CELL_SIZE - 2 * margin), (x + CELL_SIZE - 2 * margin, y), LINE_WIDTH)
+
+    def draw_o(self, row, col):
+        margin = CELL_SIZE // 4
+        center_x = col * CELL_SIZE + CELL_SIZE // 2
+        center_y = row * CELL_SIZE + CELL_SIZE // 2
+        radius = CELL_SIZE // 2 - margin
+        pygame.draw.circle(screen, BLUE, (center_x, center_y), radius, LINE_WIDTH)
+
+    def is_winner(self, player):
+        # Check rows
+        for row in self.board:
+            if all(cell == player for cell in row):
+                return True
+        # Check columns
+        for col in range(3):
+            if all(self.board[row][col] == player for row in range(3)):
+                return True
+        # Check diagonals
+        if all(self.board[i][i] == player for i in range(3)):
+            return True
+        if all(self.board[i][2-i] == player for i in range(3)):
+            return True
+        return False
+
+    def is_draw(self):
+        return all(cell != ' ' for row in self.board for cell in row) and not self.is_winner('X') and not self.is_winner('O')
+
+    def is_terminal(self):
+        return self.is_winner('X') or self.is_winner('O') or self.is_draw()
+
+    def get_empty_cells(self):
+        return [(i, j) for i in range(3) for j in range(3) if self.board[i][j] == ' ']
+
+    def ordered_moves(self):
+        return [(i, j) for i, j in MOVE_ORDER if self.board[i][j] == ' ']
+
+    def make_move(self, row, col, player):
+        if self.board[row][col] == ' ':
+            self.board[row][col] = player
+            self._toggle_hashes(row * 3 + col, player)
+            self.moves_made += 1
+            return True
+        return False
+
+    def clone(self):
+        """Copy of the position for the AI worker, so the search never touches the drawn board."""
+        copy = TicTacToe()
+        copy.board = [row[:] for row in self.board]
+        copy.current_player = self.current_player
+        copy.hashes = self.hashes[:]
+        copy.moves_made = self.moves_made
+        return copy
+
+    def undo_move(self, row, col):
+        self._toggle_hashes(row * 3 + col, self.board[row][col])
+        self.moves_made -= 1
+        self.board[row][col] = ' '
+
+    def _toggle_hashes(self, cell, player):
+        for t, (_, image) in enumerate(SYMMETRIES):
+            self.hashes[t] ^= ZOBRIST[image[cell], player]
+
+    def wins_through(self, row, col, player):
+        """Check only the lines through the last move instead of the whole board."""
+        b = self.board
+        if all(b[row][j] == player for j in range(3)) or all(b[i][col] == player for i in range(3)):
+            return True
+        if row == col and all(b[i][i] == player for i in range(3)):
+            return True
+        return row + col == 2 and all(b[i][2-i] == player for i in range(3))
+
+# Zobrist keys: a random 64-bit number per (cell, player), plus one per side to move
+ZOBRIST = {(cell, p): random.getrandbits(64) for cell in range(9) for p in 'XO'}
+SIDE_TO_MOVE = {'X': random.getrandbits(64), 'O': random.getrandbits(64)}
+SYMMETRIES = symmetries(3, 3)
+# Move ordering: center, then corners, then edges
+MOVE_ORDER = [(1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1)]
+EXACT, LOWER, UPPER = 0, 1, 2
+# canonical hash: (score, bound flag, best move, depth searched); kept across moves and games
+transposition_table = {}
+
+class SearchTimeout(Exception):
+    """Raised inside the search once the per-move time budget is spent."""
+
+def minimax(game, player):
+    """Minimax algorithm for Tic-Tac-Toe with alpha-beta pruning and a transposition table."""
+    if game.is_winner('X'):
+        return 1, None
+    if game.is_winner('O'):
+        return -1, None
+    if game.is_draw():
+        return 0, None
+    return alphabeta(game, player, -inf, inf)
+
+def alphabeta(game, player, alpha, beta, depth=None, deadline=None):
+    """Alpha-beta search below a non-terminal position.
+
+    Works on any game with the TicTacToe move API, including the m,n,k
+    bitboard engine in mnk.py. depth limits the plies searched (positions
+    at the horizon score 0) and deadline is a time.perf_counter() value
+    after which SearchTimeout is raised.
+    """
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SearchTimeout
+    remaining = game.size - game.moves_made
+    if depth is None or depth > remaining:
+        depth = remaining  # Deep enough to reach the end of the game
+    if depth == 0:
+        return 0, None
+
+    # Rotated and reflected positions share one entry, keyed by the smallest
+    # of their hashes; moves are stored as seen through that symmetry
+    key, sym = min((h, t) for t, h in enumerate(game.hashes))
+    key ^= SIDE_TO_MOVE[player]
+    alpha_orig, beta_orig = alpha, beta
+    tt_move = None
+    entry = transposition_table.get(key)
+    if entry:
+        score, flag, tt_move, tt_depth = entry
+        tt_move = from_canonical(tt_move, sym, game.rows, game.cols) if tt_move else None
+        # A shallower entry is not trusted, but its move still leads the ordering
+        if tt_depth >= depth:
+            if flag == EXACT:
+                return score, tt_move
+            if flag == LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score, tt_move
+
+    # Try the stored best move first, then the game's static order
+    moves = game.ordered_moves()
+    if tt_move in moves:
+        moves.remove(tt_move)
+        moves.insert(0, tt_move)
+    if not moves:
+        return 0, None
+
+    opponent = 'O' if player == 'X' else 'X'
+    best_score = -inf if player == 'X' else inf  # X is MAX, O is MIN
+    best_move = None
+    for row, col in moves:
+        game.make_move(row, col, player)
+        if game.wins_through(row, col, player):
+            score = 1 if player == 'X' else -1
+        elif game.moves_made == game.size:
+            score = 0
+        else:
+            score, _ = alphabeta(game, opponent, alpha, beta, depth - 1, deadline)
+        game.undo_move(row, col)
+
+        if player == 'X':
+            if score > best_score:
+                best_score, best_move = score, (row, col)
+            alpha = max(alpha, score)
+        else:
+            if score < best_score:
+                best_score, best_move = score, (row, col)
+            beta = min(beta, score)
+        if alpha >= beta:
+            break
+
+    if best_score <= alpha_orig:
+        flag = UPPER
+    elif best_score >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    stored_move = to_canonical(best_move, sym, game.rows, game.cols) if best_move else None
+    transposition_table[key] = (best_score, flag, stored_move, depth)
+    return best_score, best_move
+
+def iterative_deepening(game, player, time_budget=AI_TIME_BUDGET):
+    """Search one ply deeper at a time until the budget runs out.
+
+    Always returns the best move of the deepest completed iteration; the
+    transposition table carries move ordering from one depth to the next.
+    """
+    deadline = time.perf_counter() + time_budget
+    best_move = game.ordered_moves()[0]
+    for depth in range(1, game.size - game.moves_made + 1):
+        try:
+            score, move = alphabeta(game, player, -inf, inf, depth, deadline)
+        except SearchTimeout:
+            break
+        if move is not None:
+            best_move = move
+        if score != 0:
+            break  # Forced win or loss found, deeper search cannot change it
+    return best_move
+
+async def main():
+    game = TicTacToe()
+    game.draw_board()
+    ai_task = None  # Pending AI search, if any
+
+    while True:
+        if game.game_over:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                    game = TicTacToe()  # Restart game
+                    game.draw_board()
+            await asyncio.sleep(1.0 / FPS)
+            continue
+
+        if game.current_player == 'X':
+            # AI's turn: think in a worker thread so frames keep rendering
+            if ai_task is None and OPENING_BOOK is not None:
+                move = book_move(OPENING_BOOK, game.board)
+                if move:  # Book hit: no search needed
+                    ai_task = asyncio.get_running_loop().create_future()
+                    ai_task.set_result(move)
+            if ai_task is None:
+                if platform.system() == "Emscripten":  # No threads in the browser build
+                    ai_task = asyncio.get_running_loop().create_future()
+                    ai_task.set_result(iterative_deepening(game.clone(), 'X'))
+                else:
+                    ai_task = asyncio.ensure_future(asyncio.to_thread(iterative_deepening, game.clone(), 'X'))
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return
+            move = ai_task.result() if ai_task.done() else None
+            if move:
+                ai_task = None
+                row, col = move
+                game.make_move(row, col, 'X')
+                game.current_player = 'O'
+                game.draw_board()
+                # Check game status
+                if game.is_winner('X'):
+                    game.game_over = True
+                    game.message = "AI (X) Wins! Press R to Restart"
+                elif game.is_draw():
+                    game.game_over = True
+                    game.message = "Draw! Press R to Restart"
+        else:
+            # Human's turn
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return
+                if event.type == pygame.MOUSEBUTTONDOWN and not game.game_over:
+                    x, y = pygame.mouse.get_pos()
+                    row, col = y // CELL_SIZE, x // CELL_SIZE
+                    if game.make_move(row, col, 'O'):
+                        game.current_player = 'X'
+                        game.draw_board()
+                        # Check game status
+                        if game.is_winner('O'):
+                            game.game_over = True
+                            game.message = "You (O) Win! Press R to Restart"
+                        elif game.is_draw():
+                            game.game_over = True
+                            game.message = "Draw! Press R to Restart"
+
+        await asyncio.sleep(1.0 / FPS)
+
+if platform.system() == "Emscripten":
+    asyncio.ensure_future(main())
+else:
+    if __name__ == "__main__":
         asyncio.run(main())
\ No newline at end of file
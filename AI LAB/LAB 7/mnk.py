@@ -0,0 +1,143 @@
+import random
+from functools import lru_cache
+
+from symmetry import symmetries
+
+
+@lru_cache(maxsize=None)
+def win_masks(rows, cols, k):
+    """Bitmasks of every k-in-a-row line on a rows x cols board (bit = row * cols + col)."""
+    masks = []
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    mask = 0
+                    for step in range(k):
+                        mask |= 1 << ((r + dr * step) * cols + c + dc * step)
+                    masks.append(mask)
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(rows, cols, k):
+    """Random 64-bit keys per (cell, player), shared by every game with these rules.
+
+    'empty' seeds the hash of the empty board, so positions of different
+    m,n,k games never share a transposition-table entry.
+    """
+    keys = {(cell, p): random.getrandbits(64) for cell in range(rows * cols) for p in 'XO'}
+    keys['empty'] = random.getrandbits(64)
+    return keys
+
+
+class MNKGame:
+    """m x n board where k in a row wins, stored as one integer bitboard per player.
+
+    Moves are XORs on the bitboards, win checks test the precomputed line
+    masks through the last cell, and legal moves are a single integer mask.
+    It also exposes the TicTacToe methods (get_empty_cells, make_move,
+    undo_move, wins_through, ...) so minimax can search it unchanged.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.size = rows * cols
+        self.full_mask = (1 << self.size) - 1
+        self.bits = {'X': 0, 'O': 0}
+        self.current_player = 'X'
+        self.zobrist = zobrist_keys(rows, cols, k)
+        self.symmetries = symmetries(rows, cols)
+        # Hash of the board seen through each symmetry, so minimax can share entries
+        self.hashes = [self.zobrist['empty']] * len(self.symmetries)
+        self.moves_made = 0
+        self.win_masks = win_masks(rows, cols, k)
+        self.masks_through = [[m for m in self.win_masks if m >> cell & 1] for cell in range(self.size)]
+        # Cells closest to the center first, they take part in the most lines
+        center_r, center_c = (rows - 1) / 2, (cols - 1) / 2
+        self.move_order = sorted(range(self.size),
+                                 key=lambda c: abs(c // cols - center_r) + abs(c % cols - center_c))
+
+    # Bitboard API
+    @property
+    def legal_moves(self):
+        return self.full_mask & ~(self.bits['X'] | self.bits['O'])
+
+    def make(self, cell, player):
+        self.bits[player] ^= 1 << cell
+        self._toggle_hashes(cell, player)
+        self.moves_made += 1
+
+    def undo(self, cell, player):
+        self.bits[player] ^= 1 << cell
+        self._toggle_hashes(cell, player)
+        self.moves_made -= 1
+
+    def _toggle_hashes(self, cell, player):
+        for t, (_, image) in enumerate(self.symmetries):
+            self.hashes[t] ^= self.zobrist[image[cell], player]
+
+    def wins_at(self, cell, player):
+        stones = self.bits[player]
+        return any(stones & m == m for m in self.masks_through[cell])
+
+    # TicTacToe-compatible API
+    @property
+    def board(self):
+        return [['X' if self.bits['X'] >> (r * self.cols + c) & 1 else
+                 'O' if self.bits['O'] >> (r * self.cols + c) & 1 else ' '
+                 for c in range(self.cols)] for r in range(self.rows)]
+
+    def print_board(self):
+        for row in self.board:
+            print('|'.join(row))
+            print('-' * (2 * self.cols - 1))
+        print()
+
+    def is_winner(self, player):
+        stones = self.bits[player]
+        return any(stones & m == m for m in self.win_masks)
+
+    def is_draw(self):
+        return self.legal_moves == 0 and not self.is_winner('X') and not self.is_winner('O')
+
+    def is_terminal(self):
+        return self.is_winner('X') or self.is_winner('O') or self.legal_moves == 0
+
+    def get_empty_cells(self):
+        free = self.legal_moves
+        return [(c // self.cols, c % self.cols) for c in range(self.size) if free >> c & 1]
+
+    def ordered_moves(self):
+        free = self.legal_moves
+        return [(c // self.cols, c % self.cols) for c in self.move_order if free >> c & 1]
+
+    def make_move(self, row, col, player):
+        cell = row * self.cols + col
+        if self.legal_moves >> cell & 1:
+            self.make(cell, player)
+            return True
+        return False
+
+    def undo_move(self, row, col):
+        cell = row * self.cols + col
+        self.undo(cell, 'X' if self.bits['X'] >> cell & 1 else 'O')
+
+    def wins_through(self, row, col, player):
+        return self.wins_at(row * self.cols + col, player)
+
+
+# Example usage: AI vs AI on a 4x4 board with 3 in a row
+if __name__ == "__main__":
+    from boring_tictactoe import minimax
+
+    game = MNKGame(4, 4, 3)
+    player = 'X'
+    while not game.is_terminal():
+        _, (row, col) = minimax(game, player)
+        game.make_move(row, col, player)
+        print(f"{player} plays ({row}, {col})")
+        player = 'O' if player == 'X' else 'X'
+    game.print_board()
+    print("X wins!" if game.is_winner('X') else "O wins!" if game.is_winner('O') else "Draw!")
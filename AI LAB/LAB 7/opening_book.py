@@ -0,0 +1,80 @@
+import mmap
+import os
+
+from boring_tictactoe import TicTacToe, minimax
+from symmetry import canonicalize, from_canonical
+
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+NO_MOVE = 255
+VALUES = {' ': 0, 'X': 1, 'O': 2}
+
+
+def encode(cells):
+    """Base-3 code of a flat 9-cell board (0 empty, 1 X, 2 O)."""
+    code = 0
+    for value in reversed(cells):
+        code = code * 3 + value
+    return code
+
+
+def canonical(board):
+    """Code of the board's symmetry-class representative and the symmetry mapping onto it."""
+    cells = [VALUES[board[r][c]] for r in range(3) for c in range(3)]
+    representative, t = canonicalize(cells, 3, 3)
+    return encode(representative), representative, t
+
+
+def build_book():
+    """Solve every reachable non-terminal position once; returns a 3^9-byte table."""
+    book = bytearray([NO_MOVE]) * 3 ** 9
+    game = TicTacToe()
+
+    def visit(player):
+        code, representative, _ = canonical(game.board)
+        if game.is_terminal() or book[code] != NO_MOVE:
+            return
+        # Solve the representative so the stored cell needs no remapping
+        solved = TicTacToe()
+        for cell, value in enumerate(representative):
+            if value:
+                solved.make_move(cell // 3, cell % 3, 'X' if value == 1 else 'O')
+        _, (row, col) = minimax(solved, player)
+        book[code] = row * 3 + col
+
+        opponent = 'O' if player == 'X' else 'X'
+        for row, col in game.get_empty_cells():
+            game.make_move(row, col, player)
+            visit(opponent)
+            game.undo_move(row, col)
+
+    visit('X')
+    return bytes(book)
+
+
+def write_book(path=BOOK_PATH):
+    book = build_book()
+    with open(path, "wb") as f:
+        f.write(book)
+    return sum(1 for move in book if move != NO_MOVE)
+
+
+def load_book(path=BOOK_PATH):
+    """Memory-map the book read-only, building it first if it does not exist yet."""
+    if not os.path.exists(path):
+        write_book(path)
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def book_move(book, board):
+    """Best (row, col) for the side to move, or None if the position is not in the book."""
+    code, _, t = canonical(board)
+    move = book[code]
+    if move == NO_MOVE:
+        return None
+    return from_canonical((move // 3, move % 3), t, 3, 3)
+
+
+if __name__ == "__main__":
+    entries = write_book()
+    print(f"Opening book with {entries} positions saved to '{BOOK_PATH}'")
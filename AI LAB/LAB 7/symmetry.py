@@ -0,0 +1,63 @@
+# Same module as LAB 5/symmetry.py (each lab folder runs standalone); keep the two in sync
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def symmetries(rows, cols):
+    """Cell permutations for every rotation/reflection that keeps a rows x cols board's shape.
+
+    Each entry is (perm, image): the transformed board holds cells[perm[i]]
+    at cell i, and original cell c lands on image[c]. Square boards have
+    8 symmetries, rectangular ones 4. The identity is always first.
+    """
+    maps = [
+        lambda r, c: (r, c),
+        lambda r, c: (rows - 1 - r, cols - 1 - c),
+        lambda r, c: (r, cols - 1 - c),
+        lambda r, c: (rows - 1 - r, c),
+    ]
+    if rows == cols:
+        maps += [
+            lambda r, c: (c, rows - 1 - r),
+            lambda r, c: (cols - 1 - c, r),
+            lambda r, c: (c, r),
+            lambda r, c: (cols - 1 - c, rows - 1 - r),
+        ]
+    result = []
+    for transform in maps:
+        image = [0] * (rows * cols)
+        perm = [0] * (rows * cols)
+        for r in range(rows):
+            for c in range(cols):
+                new_r, new_c = transform(r, c)
+                image[r * cols + c] = new_r * cols + new_c
+                perm[new_r * cols + new_c] = r * cols + c
+        result.append((tuple(perm), tuple(image)))
+    return tuple(result)
+
+
+def transform(cells, t, rows, cols):
+    """Flat cells as seen through symmetry t."""
+    perm = symmetries(rows, cols)[t][0]
+    return tuple(cells[i] for i in perm)
+
+
+def canonicalize(cells, rows, cols):
+    """Representative of the symmetry class of a flat board and the symmetry t producing it.
+
+    The representative is the smallest transformed tuple, so every board
+    in a class maps to the same one.
+    """
+    return min((transform(cells, t, rows, cols), t) for t in range(len(symmetries(rows, cols))))
+
+
+def to_canonical(move, t, rows, cols):
+    """Map a (row, col) move on the original board onto the board seen through t."""
+    cell = symmetries(rows, cols)[t][1][move[0] * cols + move[1]]
+    return cell // cols, cell % cols
+
+
+def from_canonical(move, t, rows, cols):
+    """Map a (row, col) move on the board seen through t back onto the original."""
+    cell = symmetries(rows, cols)[t][0][move[0] * cols + move[1]]
+    return cell // cols, cell % cols
@@ -0,0 +1,185 @@
+import math
+import random
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from construct import construct_tour
+from hillclimb import compute_tour_cost
+from instance import as_distance_matrix, distance_matrix
+from moves import MOVES, apply_move, apply_or_opt, or_opt_delta
+
+# Proposals between clock checks and temperature updates
+CHUNK = 256
+
+
+class GeometricSchedule:
+    """T falls geometrically from t_start to t_end over the time budget."""
+
+    def __init__(self, t_start: float, t_end: float):
+        self.t_start, self.t_end = t_start, t_end
+
+    def temperature(self, progress: float, improved: bool) -> float:
+        return self.t_start * (self.t_end / self.t_start) ** progress
+
+
+class AdaptiveSchedule:
+    """Cool at the pace that reaches t_end at the deadline, adjusted by progress.
+
+    Each update covers the share of the remaining (log) temperature range
+    that the elapsed time is of the remaining budget; that share is halved
+    while the best tour keeps improving and doubled while it stalls, so
+    time is spent at the temperatures where the instance still improves.
+    """
+
+    def __init__(self, t_start: float, t_end: float, slow: float = 0.5, fast: float = 2.0):
+        self.t, self.t_end = t_start, t_end
+        self.slow, self.fast = slow, fast
+        self.progress = 0.0
+
+    def temperature(self, progress: float, improved: bool) -> float:
+        share = (progress - self.progress) / max(1.0 - self.progress, 1e-9)
+        self.progress = progress
+        share *= self.slow if improved else self.fast
+        self.t *= (self.t_end / self.t) ** min(share, 1.0)
+        return self.t
+
+
+class ReheatingSchedule(GeometricSchedule):
+    """Geometric cooling, with the temperature boosted again when the best tour stalls.
+
+    After patience updates without a new best the temperature is multiplied
+    by reheat; the boost then decays back towards the base curve.
+    """
+
+    def __init__(self, t_start: float, t_end: float, patience: int = 200,
+                 reheat: float = 20.0, decay: float = 0.97):
+        super().__init__(t_start, t_end)
+        self.patience, self.reheat, self.decay = patience, reheat, decay
+        self.boost = 1.0
+        self.stalled = 0
+
+    def temperature(self, progress: float, improved: bool) -> float:
+        self.stalled = 0 if improved else self.stalled + 1
+        if self.stalled >= self.patience:
+            self.boost, self.stalled = self.reheat, 0
+        else:
+            self.boost = max(1.0, self.boost * self.decay)
+        return super().temperature(progress, improved) * self.boost
+
+
+SCHEDULES = {
+    'geometric': GeometricSchedule,
+    'adaptive': AdaptiveSchedule,
+    'reheating': ReheatingSchedule,
+}
+
+
+def propose(tour, n, kind, rng, dist_matrix):
+    """Random move of the given kind as (delta, args) without touching the tour."""
+    if kind == 'or_opt':
+        length = rng.randint(1, min(3, n - 2))
+        i = rng.randint(1, n - length)
+        # Insertion point outside [i - 1, i + length - 1]
+        j = rng.randrange(n - length - 1)
+        if j >= i - 1:
+            j += length + 1
+        return or_opt_delta(tour, i, length, j, dist_matrix), (i, length, j)
+    i, j = sorted(rng.sample(range(1, n), 2))
+    return MOVES[kind][0](tour, i, j, dist_matrix), (i, j)
+
+
+def initial_temperature(dist_matrix, n, rng, samples: int = 200) -> float:
+    """Mean distance from a city to its nearest neighbor, over a sample of cities.
+
+    That is the length scale of edges in a good tour, so uphill moves of
+    that size start out accepted about a third of the time.
+    """
+    cities = rng.sample(range(n), min(samples, n))
+    nearest = [min(dist_matrix[c][o] for o in range(n) if o != c) for c in cities]
+    return max(sum(nearest) / len(nearest), 1e-12)
+
+
+def simulated_annealing_tsp(dist_matrix, time_limit: float = 10.0, schedule: str = 'geometric',
+                            moves: Sequence[str] = ('two_opt', 'or_opt', 'swap'),
+                            initial_tour: Optional[List[int]] = None, seed: Optional[int] = None,
+                            t_start: Optional[float] = None, t_end: Optional[float] = None,
+                            max_iterations: Optional[int] = None, start: str = 'greedy',
+                            verbose: bool = False) -> Tuple[List[int], float]:
+    """Solve TSP with simulated annealing under a wall-clock budget.
+
+    Proposals are random swap, 2-opt or or-opt moves scored by their O(1)
+    deltas. The schedule ('geometric', 'adaptive' or 'reheating') sets the
+    temperature from the fraction of the budget used and whether the best
+    tour is still improving. Starts from initial_tour or else the
+    construct.py tour named by start. Returns the best tour seen, not the
+    final one.
+    """
+    instance = dist_matrix  # Kept for constructions that need coordinates
+    dist_matrix = as_distance_matrix(dist_matrix)
+    n = len(dist_matrix)
+    if n <= 3:
+        tour = list(range(n)) + [0]
+        return tour, compute_tour_cost(tour, dist_matrix)
+
+    rng = random.Random(seed)
+    tour = list(initial_tour) if initial_tour is not None else construct_tour(instance, start, rng)[0]
+    cost = compute_tour_cost(tour, dist_matrix)
+    if t_start is None:
+        t_start = initial_temperature(dist_matrix, n, rng)
+    if t_end is None:
+        t_end = t_start * 1e-2
+    cooling = SCHEDULES[schedule](t_start, t_end)
+
+    # The best tour is only copied when the search is about to leave it
+    best_tour, best_cost = None, cost
+    at_best = True
+    start_time = time.perf_counter()
+    next_report = 1.0
+    iteration = 0
+    improved = False
+    temperature = t_start
+
+    while True:
+        if iteration % CHUNK == 0:
+            elapsed = time.perf_counter() - start_time
+            if elapsed >= time_limit or (max_iterations is not None and iteration >= max_iterations):
+                break
+            if iteration:
+                temperature = cooling.temperature(elapsed / time_limit, improved)
+                improved = False
+            if verbose and elapsed >= next_report:
+                print(f"{elapsed:.1f}s: best {best_cost:.4f}, current {cost:.4f}, T={temperature:.4g}")
+                next_report += 1.0
+        iteration += 1
+
+        kind = moves[rng.randrange(len(moves))]
+        delta, args = propose(tour, n, kind, rng, dist_matrix)
+        if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+            continue
+
+        if delta > 0 and at_best:
+            best_tour, at_best = tour.copy(), False
+        if kind == 'or_opt':
+            apply_or_opt(tour, *args)
+        else:
+            apply_move(tour, *args, kind)
+        cost += delta
+        if cost < best_cost:
+            best_cost, at_best, improved = cost, True, True
+
+    if at_best:
+        best_tour = tour
+    # Re-score once so round-off from summed deltas does not leak into the result
+    return best_tour, compute_tour_cost(best_tour, dist_matrix)
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    cities = np.random.rand(1000, 2)
+    dist = distance_matrix(cities).tolist()
+    for name in SCHEDULES:
+        tour, cost = simulated_annealing_tsp(dist, time_limit=10.0, schedule=name, seed=1)
+        print(f"Simulated annealing ({name}): cost {cost:.4f} on {len(cities)} cities")
@@ -1,5 +1,9 @@
 import random
 
+from construct import construct_tour
+from frontier import Frontier
+from instance import as_distance_matrix
+
 def compute_tour_cost(tour, dist_matrix):
     """Calculate the cost of a tour (partial or complete)."""
     cost = 0.0
@@ -29,30 +33,81 @@ def get_and_successors(tour, dist_matrix):
             successors.append((new_tour, cost, set()))
     return successors
 
-def ao_star_tsp(dist_matrix, max_iterations=50):
-    """Solve TSP using AO* search with an And/Or graph."""
+def backpropagate(tour, cost, n, parents, child_costs, best_child, solved, frontier):
+    """Push a node's new cost up through its ancestors.
+
+    Every expanded node caches its children's costs and its best child, so
+    an update only touches the cache on the path to the root. It stops at
+    the first ancestor whose cost and solved status do not change. An
+    ancestor that is queued again (2-opt can regenerate a tour) is re-keyed
+    to its backed-up cost.
+    """
+    child, parent = tour, parents.get(tour)
+    while parent is not None:
+        children = child_costs[parent]
+        children[child] = cost
+        old_cost, old_best = best_child[parent]
+        if cost < old_cost:
+            best_child[parent] = (cost, child)
+        elif child == old_best and cost > old_cost:
+            # Only rescan the children when the best one got worse
+            best_child[parent] = min((c, t) for t, c in children.items())
+        new_cost, new_best = best_child[parent]
+
+        # Complete tours are solutions; an OR node is solved through its best child
+        is_solved = len(parent) == n + 1 or new_best in solved
+        if new_cost == old_cost and is_solved == (parent in solved):
+            break
+        if is_solved:
+            solved.add(parent)
+        else:
+            solved.discard(parent)
+        if parent in frontier:
+            frontier.update(parent, new_cost)
+        child, cost, parent = parent, new_cost, parents.get(parent)
+
+def ao_star_tsp(dist_matrix, max_iterations=50, start='greedy'):
+    """Solve TSP using AO* search with an And/Or graph.
+
+    Expanded nodes back up the cost of their best child. Once the root is
+    solved, its best children lead to a complete tour, and the search stops
+    when the best tour found costs no more than the cheapest queued node.
+    That tour is optimal only for metric costs, where inserting a city never
+    shortens a partial tour; TSPLIB rounding or arbitrary matrices can break
+    this. The construct.py tour named by start is the incumbent until the
+    search finds a cheaper complete tour.
+    """
+    instance = dist_matrix  # Kept for constructions that need coordinates
+    dist_matrix = as_distance_matrix(dist_matrix)
     n = len(dist_matrix)
     if n <= 1:
         return [0], 0.0
 
     # Initialize with a partial tour [0, 0]
     start_tour = [0, 0]
+    root = tuple(start_tour)
     start_cost = 0.0
     unvisited = set(range(1, n))
-    open_set = {tuple(start_tour): (start_cost, unvisited, None)}  # (cost, unvisited, parent)
-    best_tour = start_tour
-    best_cost = float('inf')
+    open_set = {root: (start_cost, unvisited, None)}  # (cost, unvisited, parent)
+    frontier = Frontier()  # Same tours as open_set, ordered by cost
+    frontier.push(root, start_cost)
+    best_tour, best_cost = construct_tour(instance, start)
+
+    # Cached AND/OR bookkeeping, so backpropagation never regenerates successors
+    parents = {root: None}
+    child_costs = {}  # expanded tour: {child tour: cost}
+    best_child = {}  # expanded tour: (cost, child tour)
+    solved = set()
 
     print(f"Initial tour: {start_tour}, Cost: {start_cost}")
 
     for iteration in range(max_iterations):
-        if not open_set:
+        if not frontier:
             break
 
         # Select node to expand (lowest cost)
-        current_tour = min(open_set, key=lambda x: open_set[x][0])
-        current_cost, current_unvisited, _ = open_set[current_tour]
-        del open_set[current_tour]
+        current_tour, current_cost = frontier.pop()
+        _, current_unvisited, _ = open_set.pop(current_tour)
 
         # If complete tour, check for AND successors (2-opt swaps)
         if not current_unvisited:
@@ -60,31 +115,42 @@ def ao_star_tsp(dist_matrix, max_iterations=50):
                 best_tour, best_cost = list(current_tour), current_cost
                 print(f"Iteration {iteration + 1}: Improved tour: {best_tour}, Cost: {best_cost}")
             successors = get_and_successors(list(current_tour), dist_matrix)
-            for new_tour, new_cost, _ in successors:
-                open_set[tuple(new_tour)] = (new_cost, set(), current_tour)
-            continue
+        else:
+            # OR node: expand by adding unvisited cities
+            successors = get_or_successors(list(current_tour), dist_matrix, current_unvisited)
 
-        # OR node: expand by adding unvisited cities
-        successors = get_or_successors(list(current_tour), dist_matrix, current_unvisited)
+        children = {}
         for new_tour, new_cost, new_unvisited in successors:
-            open_set[tuple(new_tour)] = (new_cost, new_unvisited, current_tour)
+            new_tour = tuple(new_tour)
+            open_set[new_tour] = (new_cost, new_unvisited, current_tour)
+            frontier.push(new_tour, new_cost)
+            parents.setdefault(new_tour, current_tour)  # First parent only, keeps links acyclic
+            if not new_unvisited:
+                solved.add(new_tour)
+            children[new_tour] = new_cost
+        if not children:
+            continue
+
+        # Backpropagate costs from the cached children
+        child_costs[current_tour] = children
+        best_child[current_tour] = min((c, t) for t, c in children.items())
+        new_cost, new_best = best_child[current_tour]
+        if not current_unvisited or new_best in solved:
+            solved.add(current_tour)
+        backpropagate(current_tour, new_cost, n, parents, child_costs, best_child, solved, frontier)
 
-        # Backpropagate costs
-        while current_tour:
-            if current_tour not in open_set:
+        if root in solved:
+            # Follow the best children down to the complete tour the root's cost came from
+            node, seen = root, set()
+            while node in best_child and node not in seen:  # 2-opt can lead back to a tour
+                seen.add(node)
+                node = best_child[node][1]
+            solved_cost = compute_tour_cost(node, dist_matrix)
+            if solved_cost < best_cost:
+                best_tour, best_cost = list(node), solved_cost
+            if not frontier or best_cost <= frontier.peek()[1]:
+                print(f"Iteration {iteration + 1}: Root solved, Cost: {best_cost}")
                 break
-            cost, unvisited, parent = open_set[current_tour]
-            if not unvisited:  # AND node
-                successors = get_and_successors(list(current_tour), dist_matrix)
-                if successors:
-                    min_cost = min(s_cost for _, s_cost, _ in successors)
-                    open_set[current_tour] = (min_cost, unvisited, parent)
-            else:  # OR node
-                successors = get_or_successors(list(current_tour), dist_matrix, unvisited)
-                if successors:
-                    min_cost = min(s_cost for _, s_cost, _ in successors)
-                    open_set[current_tour] = (min_cost, unvisited, parent)
-            current_tour = parent
 
     print("Final tour found!")
     return best_tour, best_cost
@@ -1,21 +1,24 @@
 from collections import defaultdict
 
+from frontier import Frontier
+
 def ao_star(graph, costs, is_and_node, start_node, goal_nodes, max_iterations=50):
     """Solve an And/Or graph using AO* search."""
     # Initialize open set with start node
     open_set = {start_node: (0, None)}  # node: (cost, parent)
+    frontier = Frontier()  # Same nodes as open_set, ordered by cost
+    frontier.push(start_node, 0)
     best_cost = float('inf')
     best_solution = None
 
     print(f"Starting AO* from node: {start_node}")
 
     for iteration in range(max_iterations):
-        if not open_set:
+        if not frontier:
             break
 
         # Select node to expand (lowest cost)
-        current_node = min(open_set, key=lambda x: open_set[x][0])
-        current_cost, _ = open_set[current_node]
+        current_node, current_cost = frontier.pop()
         del open_set[current_node]
 
         # If goal node, update best solution
@@ -32,6 +35,7 @@ def ao_star(graph, costs, is_and_node, start_node, goal_nodes, max_iterations=50
             succ_cost = costs.get((current_node, succ), 1)  # Default cost 1
             total_cost = current_cost + succ_cost
             open_set[succ] = (total_cost, current_node)
+            frontier.push(succ, total_cost)
 
         # Backpropagate costs
         while current_node:
@@ -51,6 +55,7 @@ def ao_star(graph, costs, is_and_node, start_node, goal_nodes, max_iterations=50
                 if len(succ_costs) == len(successors):
                     new_cost = current_cost + sum(succ_costs)
                     open_set[current_node] = (new_cost, parent)
+                    frontier.update(current_node, new_cost)
             else:  # OR node: minimum successor cost
                 succ_costs = [
                     open_set.get(s, (float('inf'), None))[0]
@@ -60,6 +65,7 @@ def ao_star(graph, costs, is_and_node, start_node, goal_nodes, max_iterations=50
                 if succ_costs:
                     new_cost = current_cost + min(succ_costs)
                     open_set[current_node] = (new_cost, parent)
+                    frontier.update(current_node, new_cost)
 
             current_node = parent
 
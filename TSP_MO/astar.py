@@ -1,91 +1,135 @@
-import numpy as np
-from typing import List, Tuple
-import heapq
-
-def calculate_distance_matrix(cities: List[Tuple[float, float]]) -> np.ndarray:
-    """Calculate Euclidean distance matrix between cities."""
-    n = len(cities)
-    dist_matrix = np.zeros((n, n))
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                dist_matrix[i][j] = np.sqrt(
-                    (cities[i][0] - cities[j][0])**2 + 
-                    (cities[i][1] - cities[j][1])**2
-                )
-    return dist_matrix
-
-def total_distance(path: List[int], dist_matrix: np.ndarray) -> float:
-    """Calculate total distance of a path."""
-    distance = 0
-    for i in range(len(path) - 1):
-        distance += dist_matrix[path[i]][path[i + 1]]
-    return distance
-
-def simple_heuristic(unvisited: List[int], dist_matrix: np.ndarray, current_city: int, start_city: int) -> float:
-    """Simple heuristic: minimum edge cost for unvisited cities plus return to start."""
-    if not unvisited:
-        return dist_matrix[current_city][start_city]
-    # Minimum cost to visit an unvisited city
-    min_edge = min(dist_matrix[current_city][i] for i in unvisited)
-    # Minimum cost to return to start from any unvisited city
-    min_return = min(dist_matrix[i][start_city] for i in unvisited)
-    return min_edge + min_return
-
-def astar_tsp(dist_matrix: np.ndarray, max_iterations: int = 10000) -> Tuple[List[int], float]:
-    """Solve TSP using A* Search with a simple heuristic."""
-    n = len(dist_matrix)
-    start_city = 0
-    
-    # Priority queue: (f_score, g_score, path, unvisited)
-    open_set = [(0, 0, [start_city], set(range(n)) - {start_city})]
-    heapq.heapify(open_set)
-    
-    best_path = None
-    best_distance = float('inf')
-    iteration = 0
-    
-    while open_set and iteration < max_iterations:
-        iteration += 1
-        f_score, g_score, path, unvisited = heapq.heappop(open_set)
-        
-        # If all cities visited, check return to start
-        if not unvisited:
-            total_dist = g_score + dist_matrix[path[-1]][start_city]
-            if total_dist < best_distance:
-                best_distance = total_dist
-                best_path = path + [start_city]
-            continue
-        
-        # Expand to neighboring cities
-        current_city = path[-1]
-        for next_city in unvisited:
-            new_path = path + [next_city]
-            new_g_score = g_score + dist_matrix[current_city][next_city]
-            new_unvisited = unvisited - {next_city}
-            
-            # Calculate heuristic
-            h_score = simple_heuristic(list(new_unvisited), dist_matrix, next_city, start_city)
-            f_score = new_g_score + h_score
-            
-            heapq.heappush(open_set, (f_score, new_g_score, new_path, new_unvisited))
-    
-    return best_path, best_distance
-
-def main():
-    # Example usage
-    np.random.seed(42)
-    n_cities = 10
-    cities = [(np.random.rand(), np.random.rand()) for _ in range(n_cities)]
-    dist_matrix = calculate_distance_matrix(cities)
-    
-    # Parameters
-    max_iterations = 10000
-    
-    # Run A* Search
-    path_astar, dist_astar = astar_tsp(dist_matrix, max_iterations)
-    print(f"A* Search - Best path: {path_astar}")
-    print(f"A* Search - Total distance: {dist_astar:.4f}")
-
-if __name__ == "__main__":
+import numpy as np
+from array import array
+from typing import List, Sequence, Tuple
+import heapq
+
+from construct import construct_tour
+from instance import as_distance_matrix, distance_matrix
+
+# Constructions whose best tour is the first upper bound
+INCUMBENTS = ('nearest_neighbor', 'greedy', 'christofides')
+
+def calculate_distance_matrix(cities: List[Tuple[float, float]]) -> np.ndarray:
+    """Calculate Euclidean distance matrix between cities."""
+    return distance_matrix(cities)
+
+def total_distance(path: List[int], dist_matrix: np.ndarray) -> float:
+    """Calculate total distance of a path."""
+    distance = 0
+    for i in range(len(path) - 1):
+        distance += dist_matrix[path[i]][path[i + 1]]
+    return distance
+
+def simple_heuristic(unvisited: List[int], dist_matrix: np.ndarray, current_city: int, start_city: int) -> float:
+    """Simple heuristic: minimum edge cost for unvisited cities plus return to start."""
+    if not unvisited:
+        return dist_matrix[current_city][start_city]
+    # Minimum cost to visit an unvisited city
+    min_edge = min(dist_matrix[current_city][i] for i in unvisited)
+    # Minimum cost to return to start from any unvisited city
+    min_return = min(dist_matrix[i][start_city] for i in unvisited)
+    return min_edge + min_return
+
+def reconstruct_path(node: int, node_city: array, node_parent: array) -> List[int]:
+    """Follow parent pointers from a search node back to the start city."""
+    path = []
+    while node != -1:
+        path.append(node_city[node])
+        node = node_parent[node]
+    return path[::-1]
+
+def astar_tsp(dist_matrix: np.ndarray, max_iterations: int = 10000,
+              incumbents: Sequence[str] = INCUMBENTS) -> Tuple[List[int], float]:
+    """Solve TSP using A* Search with a simple heuristic.
+
+    Search nodes live in flat parent-pointer tables (city, visited bitmask,
+    parent index) and the heap only holds (f, g, node) tuples, so no path
+    or set is copied per push.
+
+    Pruning: a (last city, visited set) state is only pushed when it beats
+    the best g seen for it, children whose f reaches the incumbent are cut,
+    and the incumbent starts as the best of the construct.py tours named in
+    incumbents. With no incumbents the bound starts infinite and the path
+    empty, which is plain A*. Once the popped f reaches the incumbent, the
+    incumbent is optimal and the search stops.
+    """
+    dist_matrix = as_distance_matrix(dist_matrix)
+    n = len(dist_matrix)
+    if n > 63:
+        raise ValueError("Bitmask A* supports at most 63 cities")
+    start_city = 0
+    full_mask = (1 << n) - 1
+
+    node_city = array('i', [start_city])
+    node_mask = array('q', [1 << start_city])
+    node_parent = array('i', [-1])
+    best_g = {}  # visited_mask * n + city: lowest g_score pushed so far
+
+    # Priority queue: (f_score, g_score, node)
+    open_set = [(0, 0, 0)]
+
+    best_path, best_distance = [], float('inf')
+    if incumbents:
+        best_path, best_distance = min((construct_tour(dist_matrix, method) for method in incumbents),
+                                       key=lambda found: found[1])
+    iteration = 0
+
+    while open_set and iteration < max_iterations:
+        f_score, g_score, node = heapq.heappop(open_set)
+        if f_score >= best_distance:
+            break  # Lower bound meets the incumbent: it is optimal
+        current_city = node_city[node]
+        visited = node_mask[node]
+        if g_score > best_g.get(visited * n + current_city, g_score):
+            continue  # Stale entry, a cheaper path to this state was pushed later
+        iteration += 1
+
+        # If all cities visited, check return to start
+        if visited == full_mask:
+            total_dist = g_score + dist_matrix[current_city][start_city]
+            if total_dist < best_distance:
+                best_distance = total_dist
+                best_path = reconstruct_path(node, node_city, node_parent) + [start_city]
+            continue
+
+        # Expand to neighboring cities
+        unvisited = [i for i in range(n) if not visited >> i & 1]
+        for next_city in unvisited:
+            new_g_score = g_score + dist_matrix[current_city][next_city]
+            new_visited = visited | (1 << next_city)
+            state_key = new_visited * n + next_city
+            if new_g_score >= best_g.get(state_key, float('inf')):
+                continue  # Dominated by an earlier path to the same state
+
+            # Calculate heuristic
+            remaining = [i for i in unvisited if i != next_city]
+            h_score = simple_heuristic(remaining, dist_matrix, next_city, start_city)
+            f_score = new_g_score + h_score
+            if f_score >= best_distance:
+                continue  # Cannot beat the incumbent tour
+
+            best_g[state_key] = new_g_score
+            node_city.append(next_city)
+            node_mask.append(new_visited)
+            node_parent.append(node)
+            heapq.heappush(open_set, (f_score, new_g_score, len(node_city) - 1))
+
+    return best_path, best_distance
+
+def main():
+    # Example usage
+    np.random.seed(42)
+    n_cities = 10
+    cities = [(np.random.rand(), np.random.rand()) for _ in range(n_cities)]
+    dist_matrix = calculate_distance_matrix(cities)
+    
+    # Parameters
+    max_iterations = 10000
+    
+    # Run A* Search
+    path_astar, dist_astar = astar_tsp(dist_matrix, max_iterations)
+    print(f"A* Search - Best path: {path_astar}")
+    print(f"A* Search - Total distance: {dist_astar:.4f}")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from instance import BLOCK_SIZE, as_distance_matrix, distance_matrix
+from moves import EPSILON
+from spatial import GridIndex
+from tour import Tour
+
+
+def nearest_neighbors(dist_matrix, k: int = 10, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """k nearest cities of every city, closest first, as an (n, k) int32 array.
+
+    Rows are processed in blocks; argpartition picks each row's k smallest
+    in O(n) and only those k are sorted. Distances with coordinates behind
+    them (EuclideanDistances, or a TSPInstance too large for a matrix) are
+    answered by a GridIndex instead, in O(n log n) without the matrix.
+    """
+    dist_matrix = as_distance_matrix(dist_matrix)
+    if hasattr(dist_matrix, "coords"):
+        return GridIndex(dist_matrix.coords).knn(k)
+    dist_matrix = np.asarray(dist_matrix)
+    n = len(dist_matrix)
+    k = min(k, n - 1)
+    result = np.empty((n, k), dtype=np.int32)
+    for start in range(0, n, block_size):
+        block = np.array(dist_matrix[start:start + block_size], dtype=np.float64)
+        rows = np.arange(len(block))
+        block[rows, rows + start] = np.inf  # A city is not its own neighbor
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1)
+        result[start:start + len(block)] = np.take_along_axis(nearest, order, axis=1)
+    return result
+
+
+def local_search(tour: Sequence[int], dist_matrix, neighbors,
+                 moves: Sequence[str] = ('two_opt', 'or_opt'),
+                 max_segment: int = 3) -> Tuple[List[int], float]:
+    """Improve a tour with candidate-list 2-opt and Or-opt moves and don't-look bits.
+
+    Only moves that create an edge from a city to one of its candidate
+    neighbors are tried, and the scan of a neighbor list stops once that
+    edge is no shorter than the one it would replace, so a pass costs
+    O(n * k) instead of O(n^2). Or-opt moves a segment of up to max_segment
+    cities next to a neighbor in either orientation (with reversal this is
+    the 3-opt segment insertion move). Cities whose moves all failed are
+    skipped until an edge next to them changes.
+    """
+    dist_matrix = as_distance_matrix(dist_matrix)
+    neighbors = neighbors.tolist() if isinstance(neighbors, np.ndarray) else neighbors
+    d = dist_matrix
+    tour = Tour(tour)
+    n = len(tour)
+    if n < 5:
+        return tour.tolist(), tour.cost(d)
+    succ, pred, exchange = tour.next, tour.prev, tour.two_opt_move
+
+    def two_opt(a):
+        for forward in (True, False):
+            b = succ(a) if forward else pred(a)
+            d_ab = d[a][b]
+            for c in neighbors[a]:
+                d_ac = d[a][c]
+                if d_ac >= d_ab:
+                    break
+                e = succ(c) if forward else pred(c)
+                if c == b or e == a:
+                    continue
+                delta = d_ac + d[b][e] - d_ab - d[c][e]
+                if delta < -EPSILON:
+                    exchange(a, b, c, e)
+                    return delta, (a, b, c, e)
+        return None
+
+    def or_opt(a):
+        # Segment a .. end (following the tour), placed so a sits next to neighbor c
+        segment = [a]
+        while len(segment) <= max_segment and len(segment) + 2 < n:
+            end = segment[-1]
+            p, nx = pred(a), succ(end)
+            removed = d[p][a] + d[end][nx] - d[p][nx]
+            for c in neighbors[a]:
+                d_ac = d[a][c]
+                if d_ac >= removed:
+                    break
+                if c in segment:
+                    continue
+                # After c keeping the orientation (c-a..end-v), or before it reversed (u-end..a-c)
+                for u, v, added in ((c, succ(c), d_ac + d[end][succ(c)]),
+                                    (pred(c), c, d[pred(c)][end] + d_ac)):
+                    if u in segment or v in segment or v == p:
+                        continue
+                    delta = added - d[u][v] - removed
+                    if delta < -EPSILON:
+                        # p [a..end] nx .. u v  ->  p nx .. u [end..a] v, then flip the segment back
+                        exchange(p, a, u, v)
+                        exchange(p, u, nx, end)
+                        if u == c:
+                            exchange(u, end, a, v)
+                        return delta, (p, nx, u, v, a, end)
+            segment.append(succ(end))
+        return None
+
+    searches = {'two_opt': two_opt, 'or_opt': or_opt}
+    active = deque(tour.order.tolist())
+    queued = [True] * n
+    cost = tour.cost(d)
+    while active:
+        a = active.popleft()
+        queued[a] = False
+        for name in moves:
+            found = searches[name](a)
+            if found:
+                delta, touched = found
+                cost += delta
+                # Wake up the endpoints of every changed edge
+                for city in touched + (a,):
+                    if not queued[city]:
+                        queued[city] = True
+                        active.append(city)
+                break
+
+    return tour.tolist(), cost
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    cities = np.random.rand(2000, 2)
+    dist = distance_matrix(cities)
+    start_time = time.time()
+    neighbors = nearest_neighbors(dist, 8)
+    tour = [0] + list(np.random.permutation(np.arange(1, len(cities)))) + [0]
+    tour, cost = local_search(tour, dist.tolist(), neighbors)
+    print(f"2-opt + Or-opt with 8 candidates: cost {cost:.4f} on {len(cities)} cities "
+          f"({time.time() - start_time:.2f}s)")
@@ -0,0 +1,70 @@
+import heapq
+import itertools
+
+_REMOVED = object()  # Marks a heap entry whose item was re-prioritised or removed
+
+
+class Frontier:
+    """Open list for AO*/A*-style search: a binary heap with decrease-key.
+
+    Items are looked up by hash, so push/pop/update cost O(log n) and
+    membership O(1). Updating an item invalidates its old heap entry
+    lazily instead of searching the heap for it; stale entries are
+    skipped on pop and the heap is rebuilt once they outnumber live ones.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._entries = {}  # item -> [priority, tie-break count, item]
+        self._counter = itertools.count()
+
+    def push(self, item, priority):
+        """Add an item, or change its priority if it is already queued."""
+        if item in self._entries:
+            self._invalidate(item)
+        entry = [priority, next(self._counter), item]
+        self._entries[item] = entry
+        heapq.heappush(self._heap, entry)
+
+    update = push  # decrease-key (or increase-key) is a re-push
+
+    def remove(self, item):
+        """Drop an item from the frontier."""
+        self._invalidate(item)
+
+    def pop(self):
+        """Remove and return (item, priority) with the lowest priority."""
+        while self._heap:
+            priority, _, item = heapq.heappop(self._heap)
+            if item is not _REMOVED:
+                del self._entries[item]
+                return item, priority
+        raise KeyError("pop from an empty frontier")
+
+    def peek(self):
+        """Return (item, priority) with the lowest priority without removing it."""
+        while self._heap and self._heap[0][2] is _REMOVED:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            raise KeyError("peek at an empty frontier")
+        return self._heap[0][2], self._heap[0][0]
+
+    def priority(self, item):
+        return self._entries[item][0]
+
+    def _invalidate(self, item):
+        entry = self._entries.pop(item)
+        entry[2] = _REMOVED
+        # Compact once stale entries dominate so memory stays O(live items)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [e for e in self._heap if e[2] is not _REMOVED]
+            heapq.heapify(self._heap)
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
@@ -0,0 +1,91 @@
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from instance import as_distance_matrix, distance_matrix
+
+# 2^(n-1) * (n-1) one-byte parent entries, about 92 MB at 23 cities
+MAX_CITIES = 23
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Number of set bits of every integer in the array."""
+    counts = np.zeros(len(values), dtype=np.int8)
+    values = values.copy()
+    while values.any():
+        counts += (values & 1).astype(np.int8)
+        values >>= 1
+    return counts
+
+
+def held_karp_tsp(dist_matrix: np.ndarray) -> Tuple[List[int], float]:
+    """Solve TSP exactly with Held-Karp dynamic programming over bitmask subsets.
+
+    Bit j of a subset stands for city j + 1 (city 0 is the fixed start).
+    Subsets are processed layer by layer, by number of cities, so only two
+    layers of costs are alive at once; the int8 parent table is kept whole
+    for rebuilding the tour.
+    """
+    dist_matrix = np.asarray(as_distance_matrix(dist_matrix), dtype=np.float64)
+    n = len(dist_matrix)
+    if n <= 1:
+        return [0], 0.0
+    if n > MAX_CITIES:
+        raise ValueError(f"Held-Karp is limited to {MAX_CITIES} cities, got {n}")
+
+    m = n - 1
+    inner = dist_matrix[1:, 1:]  # inner[i, j]: cost of going from city i+1 to city j+1
+    all_masks = np.arange(1 << m, dtype=np.int64)
+    counts = popcount(all_masks)
+    order = np.argsort(counts, kind="stable")
+    layer_sizes = np.bincount(counts, minlength=m + 1)
+    rank = np.empty(1 << m, dtype=np.int64)  # Position of a mask within its layer
+    parent = np.full((1 << m, m), -1, dtype=np.int8)
+
+    # Layer 1: go straight from city 0 to city j+1
+    start = layer_sizes[0]
+    masks = order[start:start + layer_sizes[1]]
+    rank[masks] = np.arange(len(masks))
+    prev_cost = np.full((len(masks), m), np.inf)
+    bits = np.log2(masks).astype(np.int64)
+    prev_cost[rank[masks], bits] = dist_matrix[0, 1:][bits]
+    start += layer_sizes[1]
+
+    for k in range(2, m + 1):
+        masks = order[start:start + layer_sizes[k]]
+        start += layer_sizes[k]
+        rank[masks] = np.arange(len(masks))
+        cost = np.full((len(masks), m), np.inf)
+        for j in range(m):
+            subset = masks[(masks >> j) & 1 == 1]
+            # Best last stop i before j, over the subset without j
+            candidates = prev_cost[rank[subset ^ (1 << j)]] + inner[:, j]
+            best = np.argmin(candidates, axis=1)
+            cost[rank[subset], j] = candidates[np.arange(len(subset)), best]
+            parent[subset, j] = best
+        prev_cost = cost
+
+    # Close the tour back to city 0
+    full = (1 << m) - 1
+    totals = prev_cost[0] + dist_matrix[1:, 0]
+    last = int(np.argmin(totals))
+    best_cost = float(totals[last])
+
+    path = []
+    mask = full
+    while last >= 0:
+        path.append(last + 1)
+        mask, last = mask ^ (1 << last), int(parent[mask, last])
+    return [0] + path[::-1] + [0], best_cost
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    n_cities = 18
+    cities = np.random.rand(n_cities, 2)
+    start_time = time.time()
+    tour, cost = held_karp_tsp(distance_matrix(cities))
+    print(f"Held-Karp - Optimal tour: {tour}")
+    print(f"Held-Karp - Total distance: {cost:.4f} ({time.time() - start_time:.2f}s)")
@@ -1,69 +1,79 @@
-import random
-
-def compute_tour_cost(tour, dist_matrix):
-    """Calculate the total cost of a tour."""
-    cost = 0.0
-    for i in range(len(tour) - 1):
-        cost += dist_matrix[tour[i]][tour[i + 1]]
-    return cost
-
-def get_neighbors(tour, dist_matrix):
-    """Generate neighboring tours using 2-opt swaps."""
-    neighbors = []
-    n = len(tour) - 1  # Exclude final return to city 0
-    for i in range(1, n - 1):
-        for j in range(i + 1, n):
-            new_tour = tour.copy()
-            new_tour[i], new_tour[j] = new_tour[j], new_tour[i]
-            cost = compute_tour_cost(new_tour, dist_matrix)
-            neighbors.append((new_tour, cost))
-    return neighbors
-
-def generate_initial_tour(n):
-    """Generate a random initial tour starting and ending at city 0."""
-    tour = [0] + list(range(1, n)) + [0]
-    random.shuffle(tour[1:-1])
-    return tour
-
-def hill_climbing_tsp(dist_matrix):
-    """Solve TSP using hill climbing with 2-opt swaps."""
-    n = len(dist_matrix)
-    if n <= 1:
-        return [0], 0.0
-
-    # Generate initial tour
-    current_tour = generate_initial_tour(n)
-    current_cost = compute_tour_cost(current_tour, dist_matrix)
-    print(f"Initial tour: {current_tour}, Cost: {current_cost}")
-
-    while True:
-        neighbors = get_neighbors(current_tour, dist_matrix)
-        if not neighbors:
-            break
-
-        # Find best neighbor
-        best_tour, best_cost = min(neighbors, key=lambda x: x[1])
-
-        # Stop if no improvement
-        if best_cost >= current_cost:
-            print("No better neighbor found. Stopping.")
-            break
-
-        # Move to best neighbor
-        current_tour, current_cost = best_tour, best_cost
-        print(f"Improved tour: {current_tour}, Cost: {current_cost}")
-
-    print("Final tour found!")
-    return current_tour, current_cost
-
-# Example usage
-if __name__ == "__main__":
-    # Example distance matrix
-    dist_matrix = [
-        [0, 10, 15, 20],
-        [10, 0, 35, 25],
-        [15, 35, 0, 30],
-        [20, 25, 30, 0]
-    ]
-    tour, cost = hill_climbing_tsp(dist_matrix)
-    print(f"\nSolution: Tour: {tour}, Cost: {cost}")
+from candidates import local_search, nearest_neighbors
+from construct import construct_tour
+from instance import as_distance_matrix
+from moves import EPSILON, SELECTORS, apply_move, iter_moves
+
+def compute_tour_cost(tour, dist_matrix):
+    """Calculate the total cost of a tour."""
+    cost = 0.0
+    for i in range(len(tour) - 1):
+        cost += dist_matrix[tour[i]][tour[i + 1]]
+    return cost
+
+def get_neighbors(tour, dist_matrix, move='swap'):
+    """Stream neighboring moves as (i, j, delta) without copying the tour."""
+    return iter_moves(tour, dist_matrix, move)
+
+def hill_climbing_tsp(dist_matrix, move='swap', mode='best', initial_tour=None, verbose=True,
+                      candidates=None, start='greedy'):
+    """Solve TSP using hill climbing with swap or 2-opt moves.
+
+    mode='best' takes the steepest move of each sweep, mode='first' takes
+    the first improving one and stops scanning there. The search starts
+    from the construct.py tour named by start ('random', 'greedy', ...)
+    unless initial_tour ([0, ..., 0]) is given, e.g. for seeded restarts.
+    candidates=k switches to 2-opt + Or-opt over each city's k nearest
+    neighbors with don't-look bits (move and mode are then unused), which
+    is O(n * k) per pass instead of O(n^2) and scales to large instances.
+    """
+    instance = dist_matrix  # Kept for constructions that need coordinates
+    dist_matrix = as_distance_matrix(dist_matrix)
+    n = len(dist_matrix)
+    if n <= 1:
+        return [0], 0.0
+
+    # Start from the given tour or a constructed one
+    current_tour = list(initial_tour) if initial_tour is not None else construct_tour(instance, start)[0]
+    current_cost = compute_tour_cost(current_tour, dist_matrix)
+    if verbose:
+        print(f"Initial tour: {current_tour}, Cost: {current_cost}")
+
+    if candidates:
+        current_tour, current_cost = local_search(current_tour, dist_matrix,
+                                                  nearest_neighbors(dist_matrix, candidates))
+        if verbose:
+            print(f"Final tour found! Cost: {current_cost}")
+        return current_tour, current_cost
+
+    while True:
+        # Pick a neighbor from the streamed (i, j, delta) moves
+        found = SELECTORS[mode](get_neighbors(current_tour, dist_matrix, move))
+
+        # Stop if no improvement
+        if found is None or found[2] >= -EPSILON:
+            if verbose:
+                print("No better neighbor found. Stopping.")
+            break
+        i, j, delta = found
+
+        # Move to best neighbor
+        apply_move(current_tour, i, j, move)
+        current_cost += delta
+        if verbose:
+            print(f"Improved tour: {current_tour}, Cost: {current_cost}")
+
+    if verbose:
+        print("Final tour found!")
+    return current_tour, current_cost
+
+# Example usage
+if __name__ == "__main__":
+    # Example distance matrix
+    dist_matrix = [
+        [0, 10, 15, 20],
+        [10, 0, 35, 25],
+        [15, 35, 0, 30],
+        [20, 25, 30, 0]
+    ]
+    tour, cost = hill_climbing_tsp(dist_matrix)
+    print(f"\nSolution: Tour: {tour}, Cost: {cost}")
@@ -0,0 +1,223 @@
+import math
+import tempfile
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Above this many cities the matrix is written to a memory-mapped file
+MEMMAP_THRESHOLD = 5000
+# Rows computed per broadcast block, keeps temporaries at block_size * n
+BLOCK_SIZE = 1024
+# Above this many cities a TSPInstance computes distances on demand instead of storing them
+LAZY_THRESHOLD = 10000
+
+
+def distance_matrix(coords, dtype=np.float64, memmap_path: Optional[str] = None,
+                    block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """Build the Euclidean distance matrix with NumPy broadcasting, block by block.
+
+    From MEMMAP_THRESHOLD cities on, the matrix is mapped from an unnamed
+    temporary file unless memmap_path names a file to keep.
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    n = len(coords)
+    if memmap_path is not None:
+        dist = np.memmap(memmap_path, dtype=dtype, mode="w+", shape=(n, n))
+    elif n >= MEMMAP_THRESHOLD:
+        # Anonymous temp file: the mapping keeps it alive, and it is gone once the matrix is freed
+        with tempfile.TemporaryFile(suffix=".dist") as f:
+            dist = np.memmap(f, dtype=dtype, mode="w+", shape=(n, n))
+    else:
+        dist = np.empty((n, n), dtype=dtype)
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        diff = coords[start:stop, None, :] - coords[None, :, :]
+        dist[start:stop] = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+    if isinstance(dist, np.memmap):
+        dist.flush()
+    return dist
+
+
+def load_tsplib(path: str) -> Tuple[str, str, np.ndarray]:
+    """Read a TSPLIB file with a NODE_COORD_SECTION into (name, edge weight type, coords)."""
+    name, weight_type, dimension = path, "EUC_2D", None
+    coords: List[Tuple[float, float]] = []
+    in_coords = False
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if in_coords:
+                if line == "EOF" or not line[0].isdigit():
+                    break
+                _, x, y = line.split()[:3]
+                coords.append((float(x), float(y)))
+            elif line.startswith("NODE_COORD_SECTION"):
+                in_coords = True
+            elif ":" in line:
+                key, value = (part.strip() for part in line.split(":", 1))
+                if key == "NAME":
+                    name = value
+                elif key == "DIMENSION":
+                    dimension = int(value)
+                elif key == "EDGE_WEIGHT_TYPE":
+                    weight_type = value
+
+    if weight_type not in ("EUC_2D", "CEIL_2D"):
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {weight_type}")
+    if dimension is not None and dimension != len(coords):
+        raise ValueError(f"Expected {dimension} cities, found {len(coords)}")
+    return name, weight_type, np.array(coords, dtype=np.float64)
+
+
+def round_distances(dist: np.ndarray, weight_type: Optional[str]) -> np.ndarray:
+    """Apply TSPLIB's integer rounding for its Euclidean types, in place."""
+    if weight_type == "EUC_2D":
+        dist += 0.5
+        np.floor(dist, out=dist)
+    elif weight_type == "CEIL_2D":
+        np.ceil(dist, out=dist)
+    return dist
+
+
+class EuclideanDistances:
+    """Distance matrix stand-in that computes entries from the coordinates on demand.
+
+    Supports the ways solvers read a matrix: d[i][j] for one entry,
+    d[rows, cols] with index arrays for many at once, and len(d). Memory
+    is O(n) instead of O(n^2); np.asarray(d) still builds the whole matrix
+    for code that needs one.
+    """
+
+    def __init__(self, coords, weight_type: Optional[str] = None):
+        self.coords = np.asarray(coords, dtype=np.float64)
+        self.weight_type = weight_type
+        self.shape = (len(self.coords), len(self.coords))
+        # Plain lists and math.hypot are the fastest path for single entries
+        self.x = self.coords[:, 0].tolist()
+        self.y = self.coords[:, 1].tolist()
+        self.rounding = {"EUC_2D": lambda d: float(math.floor(d + 0.5)),
+                         "CEIL_2D": lambda d: float(math.ceil(d))}.get(weight_type)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.between(*key)
+        return _Row(self, key)
+
+    def entry(self, i, j) -> float:
+        d = math.hypot(self.x[i] - self.x[j], self.y[i] - self.y[j])
+        return d if self.rounding is None else self.rounding(d)
+
+    def between(self, rows, cols):
+        """Distances from rows to cols, index arrays broadcast against each other."""
+        diff = self.coords[np.asarray(rows)] - self.coords[np.asarray(cols)]
+        dist = round_distances(np.asarray(np.hypot(diff[..., 0], diff[..., 1])), self.weight_type)
+        return dist if dist.ndim else float(dist)
+
+    def __array__(self, dtype=None, copy=None):
+        dist = round_distances(distance_matrix(self.coords), self.weight_type)
+        return dist if dtype is None else dist.astype(dtype)
+
+
+class _Row:
+    """Row i of an EuclideanDistances, computed entry by entry when indexed."""
+    __slots__ = ("table", "i")
+
+    def __init__(self, table: EuclideanDistances, i: int):
+        self.table, self.i = table, i
+
+    def __len__(self):
+        return len(self.table)
+
+    def __getitem__(self, j):
+        if isinstance(j, (int, np.integer)):
+            return self.table.entry(self.i, j)
+        return self.table.between(self.i, j)
+
+    def __array__(self, dtype=None, copy=None):
+        row = self.table.between(self.i, np.arange(len(self.table)))
+        return row if dtype is None else row.astype(dtype)
+
+
+class TSPInstance:
+    def __init__(self, coords, name: str = "instance", weight_type: Optional[str] = None,
+                 dtype=np.float64, memmap_path: Optional[str] = None):
+        self.coords = np.asarray(coords, dtype=np.float64)
+        self.name = name
+        self.weight_type = weight_type  # TSPLIB rounding rule, None for raw distances
+        self.dtype = dtype
+        self.memmap_path = memmap_path
+        self._dist_matrix = None
+        self._distances = None
+
+    @classmethod
+    def from_tsplib(cls, path: str, **kwargs) -> "TSPInstance":
+        name, weight_type, coords = load_tsplib(path)
+        return cls(coords, name=name, weight_type=weight_type, **kwargs)
+
+    @property
+    def dist_matrix(self) -> np.ndarray:
+        """Distance matrix, built on first use."""
+        if self._dist_matrix is None:
+            dist = distance_matrix(self.coords, self.dtype, self.memmap_path)
+            self._dist_matrix = round_distances(dist, self.weight_type)
+        return self._dist_matrix
+
+    @property
+    def distances(self):
+        """Distances for solvers: the matrix, or EuclideanDistances above LAZY_THRESHOLD cities."""
+        if self._dist_matrix is not None or len(self) <= LAZY_THRESHOLD:
+            return self.dist_matrix
+        if self._distances is None:
+            self._distances = EuclideanDistances(self.coords, self.weight_type)
+        return self._distances
+
+    def __len__(self):
+        return len(self.coords)
+
+    def __str__(self):
+        return f"{self.name}: {len(self)} cities"
+
+
+def as_distance_matrix(dist_matrix):
+    """Let solvers take either a TSPInstance or a plain distance matrix."""
+    if isinstance(dist_matrix, TSPInstance):
+        return dist_matrix.distances
+    return dist_matrix
+
+
+def as_array(dist_matrix):
+    """Distances as a NumPy array for fancy indexing, leaving on-demand distances on demand."""
+    dist_matrix = as_distance_matrix(dist_matrix)
+    return dist_matrix if isinstance(dist_matrix, EuclideanDistances) else np.asarray(dist_matrix)
+
+
+def tour_costs(tours, dist_matrix, closed: bool = True) -> np.ndarray:
+    """Costs of many tours at once: one fancy-index gather over the matrix and a row sum.
+
+    tours is a 2-D integer array with one tour per row. Closed tours
+    already return to their start ([0, ..., 0]); with closed=False the
+    edge from the last city back to the first is added.
+    """
+    dist_matrix = as_array(dist_matrix)
+    tours = np.asarray(tours, dtype=np.intp)
+    if tours.ndim != 2:
+        raise ValueError(f"tours must be a 2-D array, got {tours.ndim}-D")
+    if not closed:
+        tours = np.concatenate([tours, tours[:, :1]], axis=1)
+    return dist_matrix[tours[:, :-1], tours[:, 1:]].sum(axis=1, dtype=np.float64)
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    instance = TSPInstance(np.random.rand(2000, 2) * 1000, name="random2000")
+    print(instance)
+    print(f"Distance 0 -> 1: {instance.dist_matrix[0][1]:.4f}")
+    tours = np.pad(np.argsort(np.random.rand(1000, 1999), axis=1) + 1, ((0, 0), (1, 1)))  # [0, ..., 0]
+    print(f"Mean cost of 1000 random tours: {tour_costs(tours, instance).mean():.1f}")
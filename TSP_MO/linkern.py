@@ -0,0 +1,181 @@
+import random
+import time
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from candidates import nearest_neighbors
+from construct import construct_tour
+from hillclimb import compute_tour_cost
+from instance import as_distance_matrix, distance_matrix
+from moves import EPSILON
+from tour import Tour
+
+# Alternatives tried for t3 at the first levels of a move; deeper levels are greedy
+BREADTH = (5, 3, 1)
+# Double-bridge kicks reconnect segments inside a window of this many tour positions
+KICK_WINDOW = 50
+
+
+def lin_kernighan_tsp(dist_matrix, initial_tour: Optional[List[int]] = None, candidates: int = 8,
+                      max_depth: int = 50, breadth: Sequence[int] = BREADTH,
+                      time_limit: Optional[float] = None, seed: Optional[int] = None,
+                      start: str = 'greedy', verbose: bool = False) -> Tuple[List[int], float]:
+    """Solve TSP with Lin-Kernighan variable-depth edge exchanges.
+
+    A move starts by removing a tour edge (t1, t2) and repeatedly adds an
+    edge from the free end t2 to a candidate neighbor t3, removing the edge
+    (t3, t4) that lets the tour close again through (t4, t1). Each step is
+    one 2-opt flip of the array tour, so the chain is a valid tour at every
+    depth; it grows while the partial gain stays positive (up to max_depth
+    steps), then is rolled back to the depth with the best closed gain.
+    breadth[k] alternatives are tried at level k, greedy beyond. Cities
+    whose moves all failed are skipped until an edge next to them changes.
+    Starts from initial_tour or else the construct.py tour named by start.
+
+    Without a time_limit this runs to an LK local optimum. With one, the
+    remaining time is spent on iterated LK: a random double-bridge kick
+    inside a short window, LK from its endpoints, and the kick is undone
+    unless the tour got shorter.
+    """
+    rng = random.Random(seed)
+    if initial_tour is None:
+        initial_tour = construct_tour(dist_matrix, start, rng)[0]
+    dist_matrix = as_distance_matrix(dist_matrix)
+    d = dist_matrix
+    n = len(dist_matrix)
+    tour = Tour(initial_tour)
+    if n < 5:
+        return tour.tolist(), tour.cost(d)
+
+    neighbors = nearest_neighbors(dist_matrix, candidates).tolist()
+    succ, pred, exchange = tour.next, tour.prev, tour.two_opt_move
+    start_time = time.perf_counter()
+    deadline = start_time + time_limit if time_limit is not None else None
+    journal = []  # Flips applied since the last kick, to undo it
+
+    def place(start, cities):
+        """Write cities into the tour from position start on, keeping the index in step."""
+        tour.order[start:start + len(cities)] = cities
+        tour.pos[cities] = np.arange(start, start + len(cities))
+
+    def undo(flips):
+        for a, b, c, e in reversed(flips):
+            exchange(a, c, b, e)
+
+    def step(t1, t2, gain, level, flips, added, best):
+        """Extend the chain from the free end t2; True once a closing gain beats best[0]."""
+        forward = succ(t1) == t2
+        options = []
+        for t3 in neighbors[t2]:
+            g1 = gain - d[t2][t3]
+            if g1 <= EPSILON:  # Neighbors are sorted, so no later t3 keeps the gain positive
+                break
+            if t3 == t1 or t3 == succ(t2) or t3 == pred(t2):
+                continue
+            t4 = pred(t3) if forward else succ(t3)
+            if (min(t3, t4), max(t3, t4)) in added:  # Never remove an edge this move added
+                continue
+            options.append((g1 + d[t3][t4], t3, t4))
+        options.sort(reverse=True)
+        for g2, t3, t4 in options[:breadth[min(level, len(breadth) - 1)]]:
+            exchange(t1, t2, t4, t3)
+            flips.append((t1, t2, t4, t3))
+            added.add((min(t2, t3), max(t2, t3)))
+            closed = g2 - d[t4][t1]
+            if closed > best[0]:
+                best[0], best[1] = closed, len(flips)
+            if level + 1 < max_depth:
+                step(t1, t4, g2, level + 1, flips, added, best)
+            if best[0] > EPSILON:
+                return True
+            flips.pop()
+            added.discard((min(t2, t3), max(t2, t3)))
+            exchange(t1, t4, t2, t3)
+        return False
+
+    def improve(t1):
+        """Best LK move from t1 in either direction, applied; returns (gain, cities touched) or None."""
+        for t2 in (succ(t1), pred(t1)):
+            flips, best = [], [0.0, 0]
+            if step(t1, t2, d[t1][t2], 0, flips, set(), best):
+                undo(flips[best[1]:])
+                kept = flips[:best[1]]
+                journal.extend(kept)
+                return best[0], {city for flip in kept for city in flip}
+        return None
+
+    def optimize(active, cost):
+        """LK from every queued city until none improves (or time runs out)."""
+        queued = [False] * n
+        for city in active:
+            queued[city] = True
+        checks = 0
+        while active:
+            checks += 1
+            if deadline is not None and checks % 100 == 0 and time.perf_counter() >= deadline:
+                break
+            t1 = active.popleft()
+            queued[t1] = False
+            found = improve(t1)
+            if found:
+                gain, touched = found
+                cost -= gain
+                touched.add(t1)
+                for city in touched:
+                    if not queued[city]:
+                        queued[city] = True
+                        active.append(city)
+        return cost
+
+    cost = optimize(deque(tour.order.tolist()), tour.cost(d))
+    best_cost = cost
+    kicks = 0
+    next_report = 1.0
+    while deadline is not None and n >= 8 and time.perf_counter() < deadline:
+        # Double bridge on A B C D -> A C B D, all cut points inside one window
+        window = min(KICK_WINDOW, n - 2)
+        p1 = rng.randrange(1, n - window)
+        p2, p3 = sorted(rng.sample(range(p1 + 1, p1 + window + 1), 2))
+        o = tour
+        ends = (o[p1 - 1], o[p1], o[p2 - 1], o[p2], o[p3 - 1], o[p3])
+        kick = (d[o[p1 - 1]][o[p2]] + d[o[p3 - 1]][o[p1]] + d[o[p2 - 1]][o[p3]]
+                - d[o[p1 - 1]][o[p1]] - d[o[p2 - 1]][o[p2]] - d[o[p3 - 1]][o[p3]])
+        saved = tour.order[p1:p3].copy()
+        place(p1, np.concatenate((tour.order[p2:p3], tour.order[p1:p2])))
+        journal.clear()
+        cost = optimize(deque(ends), cost + kick)
+        kicks += 1
+        if cost < best_cost - EPSILON:
+            best_cost = cost
+        else:
+            # Flips restore the exact array order when undone, so the kick slice is back in place
+            undo(journal)
+            place(p1, saved)
+            cost = best_cost
+        elapsed = time.perf_counter() - start_time
+        if verbose and elapsed >= next_report:
+            print(f"{elapsed:.1f}s: best {best_cost:.4f} after {kicks} kicks")
+            next_report += 1.0
+
+    closed = tour.tolist()
+    # Re-score once so round-off from summed gains does not leak into the result
+    return closed, compute_tour_cost(closed, d)
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    cities = np.random.rand(2000, 2)
+    dist = distance_matrix(cities).tolist()
+    for limit in (None, 10.0):
+        start_time = time.time()
+        tour, cost = lin_kernighan_tsp(dist, time_limit=limit, seed=1)
+        label = "LK local optimum" if limit is None else f"Iterated LK ({limit:.0f}s)"
+        print(f"{label}: cost {cost:.4f} on {len(cities)} cities ({time.time() - start_time:.2f}s)")
+
+    # The same seed must give the same run, random start included
+    small = distance_matrix(np.random.rand(60, 2)).tolist()
+    costs = {lin_kernighan_tsp(small, seed=1, start='random')[1] for _ in range(3)}
+    print(f"Seeded runs from random starts reproducible: {len(costs) == 1}")
@@ -0,0 +1,106 @@
+"""Move evaluation for tours of the form [0, c1, ..., c(n-1), 0].
+
+Every delta below only looks at the edges a move touches, so scoring a
+neighbor is O(1) and the tour is only modified once a move is accepted.
+Positions i < j always refer to the movable part of the tour (1 .. n-1).
+"""
+
+
+# Deltas above this are treated as zero so float noise cannot cycle a search
+EPSILON = 1e-9
+
+
+def swap_delta(tour, i, j, dist_matrix):
+    """Cost change of swapping the cities at positions i and j."""
+    a, b, c = tour[i - 1], tour[i], tour[i + 1]
+    d, e, f = tour[j - 1], tour[j], tour[j + 1]
+    if j == i + 1:  # Adjacent cities share the middle edge
+        removed = dist_matrix[a][b] + dist_matrix[b][e] + dist_matrix[e][f]
+        added = dist_matrix[a][e] + dist_matrix[e][b] + dist_matrix[b][f]
+    else:
+        removed = dist_matrix[a][b] + dist_matrix[b][c] + dist_matrix[d][e] + dist_matrix[e][f]
+        added = dist_matrix[a][e] + dist_matrix[e][c] + dist_matrix[d][b] + dist_matrix[b][f]
+    return added - removed
+
+
+def two_opt_delta(tour, i, j, dist_matrix):
+    """Cost change of reversing the segment tour[i..j] (symmetric distances)."""
+    a, b = tour[i - 1], tour[i]
+    c, d = tour[j], tour[j + 1]
+    return dist_matrix[a][c] + dist_matrix[b][d] - dist_matrix[a][b] - dist_matrix[c][d]
+
+
+def apply_swap(tour, i, j):
+    """Swap the cities at positions i and j in place."""
+    tour[i], tour[j] = tour[j], tour[i]
+
+
+def apply_two_opt(tour, i, j):
+    """Reverse the segment tour[i..j] in place."""
+    tour[i:j + 1] = tour[i:j + 1][::-1]
+
+
+def or_opt_delta(tour, i, length, j, dist_matrix):
+    """Cost change of moving the segment tour[i..i+length-1] between positions j and j+1.
+
+    j must lie outside the segment and its predecessor (j < i - 1 or
+    j >= i + length).
+    """
+    p, s = tour[i - 1], tour[i]
+    e, nx = tour[i + length - 1], tour[i + length]
+    u, v = tour[j], tour[j + 1]
+    removed = dist_matrix[p][s] + dist_matrix[e][nx] + dist_matrix[u][v]
+    added = dist_matrix[p][nx] + dist_matrix[u][s] + dist_matrix[e][v]
+    return added - removed
+
+
+def apply_or_opt(tour, i, length, j):
+    """Move the segment tour[i..i+length-1] in place so it follows position j."""
+    segment = tour[i:i + length]
+    del tour[i:i + length]
+    if j > i:
+        j -= length
+    tour[j + 1:j + 1] = segment
+
+
+MOVES = {
+    'swap': (swap_delta, apply_swap),
+    'two_opt': (two_opt_delta, apply_two_opt),
+}
+
+
+def iter_moves(tour, dist_matrix, move='swap'):
+    """Lazily yield (i, j, delta) for every move in the neighborhood."""
+    delta_fn = MOVES[move][0]
+    n = len(tour) - 1  # Exclude final return to city 0
+    for i in range(1, n - 1):
+        for j in range(i + 1, n):
+            yield i, j, delta_fn(tour, i, j, dist_matrix)
+
+
+def first_improvement(moves):
+    """Return the first improving move, or None if there is none."""
+    for found in moves:
+        if found[2] < -EPSILON:
+            return found
+    return None
+
+
+def best_improvement(moves):
+    """Return the move with the lowest delta, or None for an empty neighborhood."""
+    best = None
+    for found in moves:
+        if best is None or found[2] < best[2]:
+            best = found
+    return best
+
+
+SELECTORS = {
+    'first': first_improvement,
+    'best': best_improvement,
+}
+
+
+def apply_move(tour, i, j, move='swap'):
+    """Apply an accepted move to the tour in place."""
+    MOVES[move][1](tour, i, j)
@@ -0,0 +1,79 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from hillclimb import hill_climbing_tsp
+from instance import as_distance_matrix, distance_matrix
+
+# Worker-side view of the shared distance matrix, set by _attach
+_shared = {}
+
+
+def _attach(name: str, shape: Tuple[int, int], dtype: str) -> None:
+    """Pool initializer: map the parent's distance matrix instead of receiving a copy."""
+    shm = shared_memory.SharedMemory(name=name)  # Pool workers share the parent's resource tracker
+    _shared["shm"] = shm
+    _shared["matrix"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _run_restart(solver: Callable, index: int, seed: np.random.SeedSequence, kwargs: dict):
+    """One restart in a worker: random start tour from this restart's own seed stream."""
+    dist_matrix = _shared["matrix"]
+    rng = np.random.default_rng(seed)
+    n = len(dist_matrix)
+    initial_tour = [0] + (rng.permutation(n - 1) + 1).tolist() + [0]
+    tour, cost = solver(dist_matrix, initial_tour=initial_tour, **kwargs)
+    return index, tour, cost
+
+
+def run_restarts(dist_matrix, num_restarts: int, solver: Callable = hill_climbing_tsp,
+                 seed: Optional[int] = None, max_workers: Optional[int] = None,
+                 **solver_kwargs) -> Iterator[Tuple[int, List[int], float]]:
+    """Run independent restarts of a local search across a process pool.
+
+    solver is a module-level function called as solver(dist_matrix,
+    initial_tour=..., **solver_kwargs) -> (tour, cost). The matrix is
+    copied once into shared memory and mapped by every worker, and each
+    restart draws its start tour from its own child of SeedSequence(seed),
+    so results do not depend on scheduling. Yields (restart index, tour,
+    cost) as restarts complete.
+    """
+    matrix = np.ascontiguousarray(as_distance_matrix(dist_matrix), dtype=np.float64)
+    shm = shared_memory.SharedMemory(create=True, size=matrix.nbytes)
+    try:
+        np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)[:] = matrix
+        seeds = np.random.SeedSequence(seed).spawn(num_restarts)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach,
+                                 initargs=(shm.name, matrix.shape, matrix.dtype.str)) as pool:
+            futures = [pool.submit(_run_restart, solver, k, seeds[k], solver_kwargs)
+                       for k in range(num_restarts)]
+            for future in as_completed(futures):
+                yield future.result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def best_of_restarts(dist_matrix, num_restarts: int, **kwargs) -> Tuple[List[int], float]:
+    """Best (tour, cost) over run_restarts()."""
+    best_tour, best_cost = None, float('inf')
+    for _, tour, cost in run_restarts(dist_matrix, num_restarts, **kwargs):
+        if cost < best_cost:
+            best_tour, best_cost = tour, cost
+    return best_tour, best_cost
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    cities = np.random.rand(60, 2)
+    dist = distance_matrix(cities)
+    for workers in sorted({1, os.cpu_count()}):
+        start_time = time.time()
+        tour, cost = best_of_restarts(dist, 32, seed=7, max_workers=workers,
+                                      move='two_opt', mode='first', verbose=False)
+        print(f"{workers} worker(s): best cost {cost:.4f} over 32 restarts ({time.time() - start_time:.2f}s)")
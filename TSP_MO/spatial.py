@@ -0,0 +1,163 @@
+import math
+import time
+from typing import Optional
+
+import numpy as np
+
+from instance import TSPInstance
+
+# Most candidate slots knn() gathers at once; larger chunks are split
+KNN_BUDGET = 1 << 22
+
+
+class GridIndex:
+    """Uniform grid over city coordinates for k-nearest and radius queries.
+
+    Cells are sized for about per_cell cities each, and cities are stored
+    sorted by cell so a cell's cities are the slice
+    cities[start[c]:start[c + 1]]. A k-nearest query scans rings of cells
+    outward until no unscanned cell can hold a closer city, which on
+    evenly spread cities touches O(k) of them. Building is one sort,
+    O(n log n), and the index takes O(n) memory.
+    """
+
+    def __init__(self, coords, per_cell: float = 2.0):
+        if isinstance(coords, TSPInstance):
+            coords = coords.coords
+        self.coords = np.asarray(coords, dtype=np.float64)
+        n = len(self.coords)
+        self.low = self.coords.min(axis=0)
+        span = self.coords.max(axis=0) - self.low
+        area = float(span[0] * span[1])
+        if area > 0:
+            self.cell = math.sqrt(area * per_cell / n)
+        else:  # Cities on a line or a single point
+            self.cell = max(float(span.max()) * per_cell / n, 1e-12)
+        self.cols = int(span[0] / self.cell) + 1
+        self.rows = int(span[1] / self.cell) + 1
+        cx, cy = self.cell_of(self.coords)
+        self.city_cell = cy * self.cols + cx
+        self.cities = np.argsort(self.city_cell, kind="stable").astype(np.int32)
+        counts = np.bincount(self.city_cell, minlength=self.rows * self.cols)
+        self.start = np.concatenate(([0], np.cumsum(counts)))
+
+    def cell_of(self, points):
+        """Grid column and row of each point (clamped onto the grid)."""
+        cells = ((np.asarray(points, dtype=np.float64) - self.low) // self.cell).astype(np.int64)
+        return (np.clip(cells[..., 0], 0, self.cols - 1), np.clip(cells[..., 1], 0, self.rows - 1))
+
+    def block(self, x0, x1, y0, y1) -> np.ndarray:
+        """Cities in the cells of columns x0..x1 and rows y0..y1 (clamped to the grid)."""
+        x0, x1 = max(x0, 0), min(x1, self.cols - 1)
+        y0, y1 = max(y0, 0), min(y1, self.rows - 1)
+        if x0 > x1 or y0 > y1:
+            return self.cities[:0]
+        # The cells of one row of the block are contiguous in the sorted order
+        rows = [self.cities[self.start[y * self.cols + x0]:self.start[y * self.cols + x1 + 1]]
+                for y in range(y0, y1 + 1)]
+        return np.concatenate(rows)
+
+    def nearest(self, point, k: int = 1, exclude: Optional[int] = None) -> np.ndarray:
+        """Indices of the k cities closest to point, closest first (exclude is skipped)."""
+        point = np.asarray(point, dtype=np.float64)
+        k = min(k, len(self.coords) - (exclude is not None))
+        cx, cy = (int(c) for c in self.cell_of(point))
+        found, dists = self.cities[:0], np.empty(0)
+        radius = 0
+        while True:
+            # Ring of cells at Chebyshev distance radius around the point's cell
+            ring = [self.block(cx - radius, cx + radius, cy - radius, cy - radius)]
+            if radius:
+                ring.append(self.block(cx - radius, cx + radius, cy + radius, cy + radius))
+                ring.append(self.block(cx - radius, cx - radius, cy - radius + 1, cy + radius - 1))
+                ring.append(self.block(cx + radius, cx + radius, cy - radius + 1, cy + radius - 1))
+            ring = np.concatenate(ring)
+            if exclude is not None:
+                ring = ring[ring != exclude]
+            found = np.concatenate((found, ring))
+            dists = np.concatenate((dists, np.hypot(*(self.coords[ring] - point).T)))
+            # Cities outside the scanned rings are at least radius cells away
+            if len(found) >= k and (np.partition(dists, k - 1)[k - 1] <= radius * self.cell
+                                    or radius > max(self.rows, self.cols)):
+                best = np.argsort(dists, kind="stable")[:k]
+                return found[best]
+            radius += 1
+
+    def within(self, point, radius: float) -> np.ndarray:
+        """Indices of the cities within radius of point, closest first."""
+        point = np.asarray(point, dtype=np.float64)
+        x0, y0 = self.cell_of(point - radius)
+        x1, y1 = self.cell_of(point + radius)
+        found = self.block(int(x0), int(x1), int(y0), int(y1))
+        dists = np.hypot(*(self.coords[found] - point).T)
+        inside = dists <= radius
+        return found[inside][np.argsort(dists[inside], kind="stable")]
+
+    def knn(self, k: int = 10, chunk: int = 4096) -> np.ndarray:
+        """k nearest cities of every city, closest first, as an (n, k) int32 array.
+
+        Every city ranks the cities of the block of cells around its own
+        cell; one grid row of a block is a contiguous slice of the sorted
+        cities, so chunk cities at a time are gathered and ranked in a few
+        NumPy operations. A city whose k-th neighbor is not provably inside
+        its block falls back to nearest().
+        """
+        n = len(self.coords)
+        k = min(k, n - 1)
+        result = np.empty((n, k), dtype=np.int32)
+        # Block half-width in cells so it holds about 3k cities on average
+        per_cell = n / (self.rows * self.cols)
+        reach = max(1, math.ceil((math.sqrt(3 * (k + 1) / per_cell) - 1) / 2))
+        offsets = np.arange(-reach, reach + 1)
+        # Consecutive cities in cell order share most of their blocks
+        pending = [self.cities[first:first + chunk] for first in range(0, n, chunk)]
+        while pending:
+            members = pending.pop()
+            cells = self.city_cell[members]
+            cy, cx = cells // self.cols, cells % self.cols
+            # Slice [lo, hi) of the sorted cities for each block row
+            x0 = np.clip(cx - reach, 0, self.cols - 1)[:, None]
+            x1 = np.clip(cx + reach, 0, self.cols - 1)[:, None]
+            y = cy[:, None] + offsets[None, :]
+            on_grid = (y >= 0) & (y < self.rows)
+            y = np.clip(y, 0, self.rows - 1)
+            lo = np.where(on_grid, self.start[y * self.cols + x0], 0)
+            hi = np.where(on_grid, self.start[y * self.cols + x1 + 1], 0)
+            slots = np.arange((hi - lo).max())
+            if len(members) > 1 and lo.size * len(slots) > KNN_BUDGET:  # Crowded cells: halve the chunk
+                pending += [members[:len(members) // 2], members[len(members) // 2:]]
+                continue
+            index = lo[:, :, None] + slots
+            valid = slots < (hi - lo)[:, :, None]
+            pool = self.cities[np.where(valid, index, 0)].reshape(len(members), -1)
+            valid = valid.reshape(len(members), -1) & (pool != members[:, None])
+            diff = self.coords[pool] - self.coords[members][:, None, :]
+            dist = np.where(valid, np.hypot(diff[..., 0], diff[..., 1]), np.inf)
+
+            nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            ranked = np.take_along_axis(dist, nearest, axis=1)
+            order = np.argsort(ranked, axis=1, kind="stable")
+            nearest = np.take_along_axis(pool, np.take_along_axis(nearest, order, axis=1), axis=1)
+            kth = ranked.max(axis=1)
+            # Distance from each city to the edge of its block, where unscanned cells begin
+            corner = np.stack([cx, cy], axis=1)
+            points = self.coords[members]
+            margin = np.minimum(points - ((corner - reach) * self.cell + self.low),
+                                (corner + reach + 1) * self.cell + self.low - points).min(axis=1)
+            proven = kth <= margin
+            result[members[proven]] = nearest[proven]
+            for city in members[~proven].tolist():
+                result[city] = self.nearest(self.coords[city], k, exclude=city)
+        return result
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    cities = np.random.rand(200000, 2)
+    start_time = time.time()
+    index = GridIndex(cities)
+    neighbors = index.knn(8)
+    print(f"8 nearest neighbors of {len(cities)} cities: {time.time() - start_time:.2f}s")
+    print(f"Nearest to (0.5, 0.5): {index.nearest((0.5, 0.5), 3).tolist()}")
+    print(f"Cities within 0.005 of (0.5, 0.5): {len(index.within((0.5, 0.5), 0.005))}")
@@ -0,0 +1,115 @@
+import time
+from typing import Iterable, List
+
+import numpy as np
+
+# Paths up to this long are flipped element by element, longer ones by one NumPy gather
+SHORT_PATH = 32
+
+
+class Tour:
+    """Cyclic tour held as an order array plus a position index (NumPy int32).
+
+    order[i] is the city at position i and pos[c] the position of city c, so
+    next/prev/between are O(1) and a 2-opt move reverses one path in place.
+    Reversing a path or the rest of the cycle gives the same tour, so the
+    shorter side is flipped: local moves touch a few cities and no move
+    touches more than n/2. Positions are cyclic (tour[n] is tour[0]), which
+    lets position-based code read it like a closed [0, ..., 0] list.
+    """
+
+    def __init__(self, cities: Iterable[int]):
+        cities = list(cities)
+        if len(cities) > 1 and cities[0] == cities[-1]:
+            cities.pop()
+        self.n = len(cities)
+        self.order = np.array(cities, dtype=np.int32)
+        self.pos = np.empty(self.n, dtype=np.int32)
+        self.pos[self.order] = np.arange(self.n, dtype=np.int32)
+        # Scalar access through memoryviews yields plain ints, much faster than NumPy indexing
+        self._order = memoryview(self.order)
+        self._pos = memoryview(self.pos)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        return self._order[i % self.n]
+
+    def next(self, city):
+        return self._order[(self._pos[city] + 1) % self.n]
+
+    def prev(self, city):
+        return self._order[(self._pos[city] - 1) % self.n]
+
+    def between(self, a, b, c):
+        """Whether b lies on the path a -> c following the tour (ends included)."""
+        pos = self._pos
+        return (pos[b] - pos[a]) % self.n <= (pos[c] - pos[a]) % self.n
+
+    def reverse(self, first, last):
+        """Reverse the path first -> last (following the tour) in place."""
+        n = self.n
+        i, j = self._pos[first], self._pos[last]
+        inner = (j - i) % n + 1
+        if 2 * inner > n:  # Flip the complement instead
+            i, j = (j + 1) % n, (i - 1) % n
+            inner = n - inner
+        if inner <= SHORT_PATH:
+            order, pos = self._order, self._pos
+            for _ in range(inner // 2):
+                a, b = order[i], order[j]
+                order[i], order[j] = b, a
+                pos[b], pos[a] = i, j
+                i = i + 1 if i + 1 < n else 0
+                j = j - 1 if j else n - 1
+        elif i + inner <= n:
+            segment = self.order[i:i + inner]
+            segment[:] = segment[::-1].copy()
+            self.pos[segment] = np.arange(i, i + inner, dtype=np.int32)
+        else:  # The path wraps around the end of the array
+            index = np.arange(i, i + inner) % n
+            self.order[index] = self.order[index[::-1]]
+            self.pos[self.order[index]] = index
+
+    def two_opt_move(self, a, b, c, e):
+        """Drop edges a-b and c-e (b, e follow a, c in one direction), add a-c and b-e.
+
+        two_opt_move(a, c, b, e) undoes it by flipping the same side again,
+        so the arrays come back exactly as they were.
+        """
+        if self.next(a) == b:
+            self.reverse(b, c)
+        else:
+            self.reverse(c, b)
+
+    def swap(self, a, b):
+        """Exchange the positions of cities a and b."""
+        order, pos = self._order, self._pos
+        i, j = pos[a], pos[b]
+        order[i], order[j] = b, a
+        pos[a], pos[b] = j, i
+
+    def cost(self, dist_matrix) -> float:
+        order = self._order
+        return sum(dist_matrix[order[i - 1]][order[i]] for i in range(self.n))
+
+    def tolist(self, start: int = 0) -> List[int]:
+        """Closed tour [start, ..., start] following the tour."""
+        i = self._pos[start]
+        return self.order[i:].tolist() + self.order[:i].tolist() + [start]
+
+
+# Example usage
+if __name__ == "__main__":
+    rng = np.random.default_rng(42)
+    n = 100000
+    tour = Tour(rng.permutation(n))
+    moves = rng.integers(0, n, size=(2000, 2)).tolist()
+    start_time = time.time()
+    for a, c in moves:
+        b, e = tour.next(a), tour.next(c)
+        if a != c and b != c:
+            tour.two_opt_move(a, b, c, e)
+    print(f"2000 random 2-opt moves on {n} cities: {time.time() - start_time:.3f}s")
+    print(f"Index consistent: {bool((tour.order[tour.pos] == np.arange(n)).all())}")